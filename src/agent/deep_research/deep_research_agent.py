@@ -32,6 +32,7 @@ while providing progress visibility and the ability to resume interrupted work.
 # The workflow flows through planning -> execution -> synthesis  #// clarifies overall flow
 
 import asyncio
+from functools import partial  # bind tool dependencies
 import json
 import logging
 import os
@@ -67,7 +68,7 @@ from src.agent.browser_use.browser_use_agent import BrowserUseAgent
 from src.browser.custom_browser import CustomBrowser
 from src.browser.custom_context import CustomBrowserContextConfig
 from src.controller.custom_controller import CustomController
-from src.utils.mcp_client import setup_mcp_client_and_tools
+from src.utils.mcp_client import release_mcp_client, setup_mcp_client_and_tools
 from src.utils.browser_launch import build_browser_launch_options  # import util for browser launch options
 from src.utils.browser_cleanup import close_browser_resources  # reuse util for closing browser
 
@@ -287,8 +288,6 @@ def create_browser_search_tool(
 ) -> StructuredTool:
     """Return a StructuredTool wired with config and stop controls."""  #// explains binding
     # Use partial to bind the dependencies that aren't part of the LLM call arguments
-    from functools import partial
-
     bound_tool_func = partial(
         _run_browser_search_tool,
         task_id=task_id,
@@ -926,7 +925,7 @@ class DeepResearchAgent:  # minimal agent for tests
     async def close_mcp_client(self):
         """Close MCP client if it was initialized."""  # cleanup helper
         if self.mcp_client:
-            await self.mcp_client.__aexit__(None, None, None)
+            await release_mcp_client(self.mcp_client)  # closes the session once no other agent shares it
             self.mcp_client = None
 
     async def _compile_graph(self):
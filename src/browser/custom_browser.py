@@ -1,5 +1,6 @@
 """Custom browser implementation with enhanced setup."""  # module docstring summarizing purpose
 import asyncio
+import functools  # cache static launch flag combinations
 
 try:  # attempt patchright first for browser automation
     from patchright.async_api import Browser as PlaywrightBrowser  # use patchright Browser when available
@@ -38,6 +39,31 @@ from .custom_context import CustomBrowserContext, CustomBrowserContextConfig
 
 logger = logging.getLogger(__name__)
 
+# Fixed leading flags for the non-Chromium engines, shared by reference across launches
+_OTHER_BROWSER_BASE_ARGS = {
+    'firefox': ('-no-remote',),
+    'webkit': ('--no-startup-window',),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _base_chrome_args(headless: bool, disable_security: bool, deterministic_rendering: bool) -> tuple[str, ...]:
+    """Return the static Chrome flags for one combination of launch options.
+
+    These flags only depend on module constants and three booleans, so they are
+    assembled once per combination instead of on every launch.
+    """  # cached because the inputs never change at runtime
+    chrome_args = list(CHROME_ARGS)  # base Chrome args list maintaining order
+    if IN_DOCKER:
+        chrome_args.extend(CHROME_DOCKER_ARGS)  # append docker specific flags
+    if headless:
+        chrome_args.extend(CHROME_HEADLESS_ARGS)  # append headless flags when requested
+    if disable_security:
+        chrome_args.extend(CHROME_DISABLE_SECURITY_ARGS)  # add security disabling flags
+    if deterministic_rendering:
+        chrome_args.extend(CHROME_DETERMINISTIC_RENDERING_ARGS)  # add deterministic rendering flags
+    return tuple(dict.fromkeys(chrome_args))  # drop repeated constants once here, e.g. the doubled crashed-bubble flag
+
 
 class CustomBrowser(Browser):
     """Browser wrapper returning CustomBrowserContext with merged settings."""  #// explains reason for subclass
@@ -60,43 +86,38 @@ class CustomBrowser(Browser):
             screen_size = get_screen_resolution()  # match visible screen size in headed mode
             offset_x, offset_y = get_window_adjustments()  # adjust for OS chrome
 
-        chrome_args = list(CHROME_ARGS)  # base Chrome args list maintaining order
-        if IN_DOCKER:
-            chrome_args.extend(CHROME_DOCKER_ARGS)  # append docker specific flags
-        if self.config.headless:
-            chrome_args.extend(CHROME_HEADLESS_ARGS)  # append headless flags when requested
-        if self.config.disable_security:
-            chrome_args.extend(CHROME_DISABLE_SECURITY_ARGS)  # add security disabling flags
-        if self.config.deterministic_rendering:
-            chrome_args.extend(CHROME_DETERMINISTIC_RENDERING_ARGS)  # add deterministic rendering flags
-        chrome_args.append(f'--window-position={offset_x},{offset_y}')  # set initial position for consistency
-        chrome_args.extend(self.config.extra_browser_args)  # finally add extra args from config
-        contain_window_size = False  # track if user provided size arg
-        for arg in self.config.extra_browser_args:
-            if "--window-size" in arg:
-                contain_window_size = True
-                break
-        if not contain_window_size:
-            chrome_args.append(
+        launch_args = [
+            f'--window-position={offset_x},{offset_y}',  # set initial position for consistency
+            *self.config.extra_browser_args,  # finally add extra args from config
+        ]
+        if not any("--window-size" in arg for arg in self.config.extra_browser_args):
+            launch_args.append(
                 f'--window-size={screen_size["width"]},{screen_size["height"]}'
             )  # append default size when absent
+        chrome_args = list(dict.fromkeys((
+            *_base_chrome_args(
+                bool(self.config.headless),
+                bool(self.config.disable_security),
+                bool(self.config.deterministic_rendering),
+            ),
+            *launch_args,
+        )))  # cached static flags plus per-launch tail, deduplicated in one C-level pass
 
         # check if port 9222 is already taken, if so remove the remote-debugging-port arg to prevent conflicts with other Chrome instances
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            if s.connect_ex(('localhost', 9222)) == 0:
-                if '--remote-debugging-port=9222' in chrome_args:
-                    chrome_args.remove('--remote-debugging-port=9222')  # remove arg only when present
+        if '--remote-debugging-port=9222' in chrome_args:  # only probe the port when the flag would be passed
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+                if s.connect_ex(('localhost', 9222)) == 0:
+                    chrome_args.remove('--remote-debugging-port=9222')  # drop flag when another instance owns the port
 
         browser_class = getattr(playwright, self.config.browser_class)
-        args = {
-            'chromium': chrome_args,  # pass computed chromium args list
-            'firefox': ['-no-remote', *self.config.extra_browser_args],  # firefox args list in order
-            'webkit': ['--no-startup-window', *self.config.extra_browser_args],  # webkit args list in order
-        }
+        if self.config.browser_class == 'chromium':
+            launch_args = chrome_args  # pass computed chromium args list
+        else:
+            launch_args = [*_OTHER_BROWSER_BASE_ARGS[self.config.browser_class], *self.config.extra_browser_args]  # firefox/webkit args in order
 
         browser = await browser_class.launch(
             headless=self.config.headless,
-            args=args[self.config.browser_class],
+            args=launch_args,
             proxy=self.config.proxy.model_dump() if self.config.proxy else None,
             handle_sigterm=False,
             handle_sigint=False,
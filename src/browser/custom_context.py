@@ -79,14 +79,16 @@ class CustomBrowserContext(BrowserContext):
                         if 'sameSite' in cookie:
                             if cookie['sameSite'] not in valid_same_site_values:
                                 logger.warning(
-                                    f"Fixed invalid sameSite value '{cookie['sameSite']}' to 'None' for cookie {cookie.get('name')}"
+                                    "Fixed invalid sameSite value '%s' to 'None' for cookie %s",
+                                    cookie['sameSite'],
+                                    cookie.get('name'),
                                 )
                                 cookie['sameSite'] = 'None'
-                    logger.info(f'🍪  Loaded {len(cookies)} cookies from {self.config.cookies_file}')
+                    logger.info('🍪  Loaded %d cookies from %s', len(cookies), self.config.cookies_file)  # formatted only when emitted
                     await context.add_cookies(cookies)  # restore browsing session
 
                 except json.JSONDecodeError as e:
-                    logger.error(f'Failed to parse cookies file: {str(e)}')
+                    logger.error('Failed to parse cookies file: %s', e)
 
         # Expose anti-detection scripts
         await context.add_init_script(  # inject JS to mask automation footprint
@@ -26,7 +26,7 @@ import os
 from langchain_core.language_models.chat_models import BaseChatModel
 from browser_use.agent.views import ActionModel, ActionResult
 
-from src.utils.mcp_client import create_tool_param_model, setup_mcp_client_and_tools
+from src.utils.mcp_client import create_tool_param_model, release_mcp_client, setup_mcp_client_and_tools
 
 from browser_use.utils import time_execution_sync
 
@@ -197,5 +197,5 @@ class CustomController(Controller):
         on the remote server.
         """  # added docstring for explaining graceful shutdown use
         if self.mcp_client:
-            await self.mcp_client.__aexit__(None, None, None)  # graceful shutdown of MCP session
+            await release_mcp_client(self.mcp_client)  # closes the session once no other agent shares it
             self.mcp_client = None  # (reset after closing & free resources)
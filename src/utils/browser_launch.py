@@ -44,20 +44,13 @@ and resource management. This module abstracts that complexity while providing
 the flexibility needed for diverse deployment scenarios.
 """
 
-import asyncio
+import functools  # memoize environment snapshot
 import logging
 import os  # needed for env lookup
-import tempfile
-from pathlib import Path
+from dataclasses import dataclass  # typed, slotted launch settings
 from typing import Any, Dict, List, Optional, Tuple  # typing for function
 
-# Playwright async API for modern, reliable browser automation
-# Chosen over alternatives like Selenium for:
-# - Better async/await support for non-blocking operations
-# - More reliable element detection and interaction
-# - Built-in waiting and retry mechanisms
-# - Better cross-browser compatibility and standardization
-from src.utils.offline import is_offline  # check if running in offline mode
+__all__ = ["LaunchOptions", "build_browser_launch_options"]  # single public launch-option builder
 
 # Module-level logger for tracking browser launch operations and failures
 # Browser launch failures are often cryptic and environment-dependent
@@ -65,6 +58,49 @@ from src.utils.offline import is_offline  # check if running in offline mode
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def _env_snapshot() -> Tuple[Optional[str], Optional[str]]:
+    """Return ``(CHROME_PATH, CHROME_USER_DATA)`` read once, empty values as ``None``.
+
+    Call ``_env_snapshot.cache_clear()`` after changing these variables at runtime.
+    """  # env is loaded by dotenv at startup and treated as read-mostly
+    return os.environ.get("CHROME_PATH") or None, os.environ.get("CHROME_USER_DATA") or None
+
+
+@functools.lru_cache(maxsize=32)
+def _window_size_arg(width: int, height: int) -> str:
+    """Return the ``--window-size`` flag for one ``(width, height)`` pair."""  # only a few presets are used in practice
+    return f"--window-size={width},{height}"
+
+
+@functools.lru_cache(maxsize=32)
+def _user_data_dir_arg(path: str) -> str:
+    """Return the ``--user-data-dir`` flag for ``path``."""  # profile dirs rarely change between launches
+    return f"--user-data-dir={path}"
+
+
+@dataclass(slots=True, frozen=True)
+class LaunchOptions:
+    """Browser settings consumed by :func:`build_browser_launch_options`."""  # typed view of the config dict
+
+    window_width: int = 1280  # default width 1280
+    window_height: int = 1100  # default height 1100
+    user_data_dir: Optional[str] = None  # custom data dir for persistent profiles
+    use_own_browser: bool = False  # launch the user's own Chrome binary
+    browser_binary_path: Optional[str] = None  # path from config
+
+    @classmethod
+    def from_dict(cls, config: Dict[str, Any]) -> "LaunchOptions":
+        """Read the launch keys from ``config`` once; unrelated keys are ignored."""  # callers pass full browser settings
+        return cls(
+            window_width=config.get("window_width", 1280),
+            window_height=config.get("window_height", 1100),
+            user_data_dir=config.get("user_data_dir", None),
+            use_own_browser=config.get("use_own_browser", False),
+            browser_binary_path=config.get("browser_binary_path", None),
+        )
+
+
 def build_browser_launch_options(config: Dict[str, Any]) -> Tuple[Optional[str], List[str]]:  # build browser options
     """Build browser binary path and extra launch arguments.
 
@@ -73,21 +109,15 @@ def build_browser_launch_options(config: Dict[str, Any]) -> Tuple[Optional[str],
     Environment variables ``CHROME_PATH`` and ``CHROME_USER_DATA`` override
     path settings when ``use_own_browser`` is true.
     """  # function description expanded
-    window_w = config.get("window_width", 1280)  # removed unused async_playwright import, default width 1280
-    window_h = config.get("window_height", 1100)  # height from config; default 1100
-    extra_args = [f"--window-size={window_w},{window_h}"]  # window geometry arg
-    browser_user_data_dir = config.get("user_data_dir", None)  # custom data dir for persistent profiles
-    if browser_user_data_dir:
-        extra_args.append(f"--user-data-dir={browser_user_data_dir}")  # add dir option
-    use_own_browser = config.get("use_own_browser", False)  # check custom browser usage
-    browser_binary_path = config.get("browser_binary_path", None)  # path from config
-    if use_own_browser:
-        browser_binary_path = os.getenv("CHROME_PATH", None) or browser_binary_path  # env override
-        if browser_binary_path == "":
-            browser_binary_path = None  # empty -> None
-        chrome_user_data = os.getenv("CHROME_USER_DATA", None)  # check env data dir
+    options = LaunchOptions.from_dict(config)  # parse config keys once into slotted fields
+    extra_args = [_window_size_arg(options.window_width, options.window_height)]  # window geometry arg
+    if options.user_data_dir:
+        extra_args.append(_user_data_dir_arg(options.user_data_dir))  # add dir option
+    if options.use_own_browser:
+        chrome_path, chrome_user_data = _env_snapshot()  # cached env overrides
+        browser_binary_path = chrome_path or options.browser_binary_path or None  # env override; empty -> None
         if chrome_user_data:
-            extra_args.append(f"--user-data-dir={chrome_user_data}")  # add env dir
+            extra_args.append(_user_data_dir_arg(chrome_user_data))  # add env dir
     else:
         browser_binary_path = None  # not using custom browser
     return browser_binary_path, extra_args  # return values
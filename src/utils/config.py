@@ -12,20 +12,20 @@ PROVIDER_DISPLAY_NAMES = {
 
 # Predefined model names for common providers
 model_names = {
-    "anthropic": ["claude-3-5-sonnet-20241022", "claude-3-5-sonnet-20240620", "claude-3-opus-20240229"],
-    "openai": ["gpt-4o", "gpt-4", "gpt-3.5-turbo", "o3-mini"],
-    "deepseek": ["deepseek-chat", "deepseek-reasoner"],
-    "google": ["gemini-2.0-flash", "gemini-2.0-flash-thinking-exp", "gemini-1.5-flash-latest",
+    "anthropic": ("claude-3-5-sonnet-20241022", "claude-3-5-sonnet-20240620", "claude-3-opus-20240229"),
+    "openai": ("gpt-4o", "gpt-4", "gpt-3.5-turbo", "o3-mini"),
+    "deepseek": ("deepseek-chat", "deepseek-reasoner"),
+    "google": ("gemini-2.0-flash", "gemini-2.0-flash-thinking-exp", "gemini-1.5-flash-latest",
                "gemini-1.5-flash-8b-latest", "gemini-2.0-flash-thinking-exp-01-21", "gemini-2.0-pro-exp-02-05",
-               "gemini-2.5-pro-preview-03-25", "gemini-2.5-flash-preview-04-17"],
-    "ollama": ["qwen2.5:7b", "qwen2.5:14b", "qwen2.5:32b", "qwen2.5-coder:14b", "qwen2.5-coder:32b", "llama2:7b",
-               "deepseek-r1:14b", "deepseek-r1:32b"],
-    "azure_openai": ["gpt-4o", "gpt-4", "gpt-3.5-turbo"],
-    "mistral": ["pixtral-large-latest", "mistral-large-latest", "mistral-small-latest", "ministral-8b-latest"],
-    "alibaba": ["qwen-plus", "qwen-max", "qwen-vl-max", "qwen-vl-plus", "qwen-turbo", "qwen-long"],
-    "moonshot": ["moonshot-v1-32k-vision-preview", "moonshot-v1-8k-vision-preview"],
-    "unbound": ["gemini-2.0-flash", "gpt-4o-mini", "gpt-4o", "gpt-4.5-preview"],
-    "siliconflow": [
+               "gemini-2.5-pro-preview-03-25", "gemini-2.5-flash-preview-04-17"),
+    "ollama": ("qwen2.5:7b", "qwen2.5:14b", "qwen2.5:32b", "qwen2.5-coder:14b", "qwen2.5-coder:32b", "llama2:7b",
+               "deepseek-r1:14b", "deepseek-r1:32b"),
+    "azure_openai": ("gpt-4o", "gpt-4", "gpt-3.5-turbo"),
+    "mistral": ("pixtral-large-latest", "mistral-large-latest", "mistral-small-latest", "ministral-8b-latest"),
+    "alibaba": ("qwen-plus", "qwen-max", "qwen-vl-max", "qwen-vl-plus", "qwen-turbo", "qwen-long"),
+    "moonshot": ("moonshot-v1-32k-vision-preview", "moonshot-v1-8k-vision-preview"),
+    "unbound": ("gemini-2.0-flash", "gpt-4o-mini", "gpt-4o", "gpt-4.5-preview"),
+    "siliconflow": (
         "deepseek-ai/DeepSeek-R1",
         "deepseek-ai/DeepSeek-V3",
         "deepseek-ai/DeepSeek-R1-Distill-Qwen-32B",
@@ -57,9 +57,9 @@ model_names = {
         "Pro/Qwen/Qwen2-1.5B-Instruct",
         "Pro/THUDM/chatglm3-6b",
         "Pro/THUDM/glm-4-9b-chat",
-    ],
-    "ibm": ["ibm/granite-vision-3.1-2b-preview", "meta-llama/llama-4-maverick-17b-128e-instruct-fp8",
-            "meta-llama/llama-3-2-90b-vision-instruct"]
+    ),
+    "ibm": ("ibm/granite-vision-3.1-2b-preview", "meta-llama/llama-4-maverick-17b-128e-instruct-fp8",
+            "meta-llama/llama-3-2-90b-vision-instruct")
 }
 """
 Configuration Management - Centralized Application Settings and Environment Handling
@@ -110,13 +110,30 @@ startup rather than allowing invalid configurations to cause runtime failures.
 This approach makes deployment issues immediately visible and debuggable.
 """
 
-import json
-import logging
-import os
-from pathlib import Path
-from typing import Any, Dict, Optional
+import functools  # memoized table accessors
+from types import MappingProxyType  # read-only views over the static tables
 
-# Module-level logger for configuration loading, validation, and error reporting
-# Configuration errors are often environmental and require detailed context for debugging
-# This logger helps track configuration resolution across different sources and environments
-logger = logging.getLogger(__name__)
+__all__ = ["PROVIDER_DISPLAY_NAMES", "model_names", "display_name", "models_for"]  # public table surface
+
+# Both tables are fixed at import time; expose read-only views so callers cannot mutate shared state
+PROVIDER_DISPLAY_NAMES = MappingProxyType(PROVIDER_DISPLAY_NAMES)
+model_names = MappingProxyType(model_names)
+
+
+# Display name for every known provider, fallbacks rendered once so lookups never format strings
+_ALL_DISPLAY_NAMES = MappingProxyType({
+    provider: PROVIDER_DISPLAY_NAMES.get(provider, provider.upper())
+    for provider in (*PROVIDER_DISPLAY_NAMES, *model_names)
+})
+
+
+def display_name(provider: str) -> str:
+    """Return the human-friendly name for ``provider``, falling back to its upper-cased key."""  # used in user-facing messages
+    name = _ALL_DISPLAY_NAMES.get(provider)  # precomputed for all known providers
+    return name if name is not None else provider.upper()
+
+
+@functools.lru_cache(maxsize=None)
+def models_for(provider: str) -> tuple:
+    """Return the predefined models for ``provider``, or an empty tuple when none are known."""  # shared tuple, safe to cache
+    return model_names.get(provider, ())
@@ -1,15 +1,23 @@
 """Utility helpers for loading configuration files safely."""  # module docstring explaining purpose
-import json, logging, os  # new utility imports for safe json loading
+import json, logging  # utility imports for safe json loading
 logger = logging.getLogger(__name__)  # logger setup for this module
 
+try:  # prefer orjson for faster parsing when installed
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # fall back to stdlib json when orjson is missing
+    _json_loads = json.loads
+
 
 def load_json_safe(path: str):  # utility to safely load json
     """Load a JSON file and return ``None`` on failure."""  # docstring describing edge cases
-    if not path or not os.path.exists(path):  # validate path exists
+    if not path:  # nothing to load
         return None  # return None if invalid
     try:
-        with open(path, "r", encoding="utf-8") as f:  # open file safely
-            return json.load(f)  # return parsed json
+        with open(path, "rb") as f:  # read raw bytes; both parsers decode UTF-8 themselves
+            return _json_loads(f.read())  # return parsed json
+    except FileNotFoundError:  # missing file: one failed open instead of a separate exists() stat
+        return None  # quiet, as before
     except Exception as e:  # catch any exception during load
         logger.error(f"Failed loading {path}: {e}")  # log failure
         return None  # return None on failure
@@ -17,11 +25,11 @@ def load_json_safe(path: str):  # utility to safely load json
 
 def load_mcp_server_config(path: str, logger) -> dict | None:  # load MCP server config with validation
     """Load MCP server JSON returning ``None`` when the file is invalid."""  # docstring describing function
-    if not path or not os.path.exists(path) or not path.endswith('.json'):  # validate path exists and is json
+    if not path or not path.endswith('.json'):  # cheap string check before touching the filesystem
         logger.warning(f"{path} is not a valid MCP file.")  # warn when invalid
         return None  # return None on invalid path
-    data = load_json_safe(path)  # use existing safe loader
-    if data is None:  # check load failure
+    data = load_json_safe(path)  # use existing safe loader; missing files return None
+    if data is None:  # check load failure, including a missing file
         logger.warning(f"{path} cannot be loaded.")  # warn when loading fails
     return data  # return parsed json or None
 
@@ -1,4 +1,3 @@
-from openai import OpenAI
 from langchain_openai import ChatOpenAI
 from src.utils.offline import is_offline, offline_guard  # offline helpers for CODEX mode; offline_guard centralizes mocks
 from langchain_core.globals import get_llm_cache
@@ -40,13 +39,8 @@ from typing import (
     Union,
     cast, List,
 )
-from langchain_anthropic import ChatAnthropic
-from langchain_mistralai import ChatMistralAI
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_ollama import ChatOllama
 from langchain_openai import AzureChatOpenAI, ChatOpenAI
-from langchain_ibm import ChatWatsonx
-from langchain_aws import ChatBedrock
+# Anthropic, Mistral, Google and IBM SDKs are imported inside their get_llm_model branches
 from pydantic import SecretStr
 
 from src.utils import config
@@ -104,9 +98,12 @@ object. The mock object implements ``invoke`` and ``ainvoke`` that each return
 ``AIMessage(content='mock response')`` so tests can run without network access.
 """
 
+import hashlib  # digest API keys before they become model cache keys
 import json
 import logging
+import threading  # guard the model cache across Gradio worker threads
 import time
+from collections import OrderedDict  # small LRU of built chat models
 from typing import Any, Dict, List, Optional, Union
 
 # Module-level logger for LLM provider operations, errors, and performance monitoring
@@ -114,24 +111,83 @@ from typing import Any, Dict, List, Optional, Union
 # Detailed logging is essential for debugging API issues and monitoring costs/performance
 logger = logging.getLogger(__name__)
 
+# Built models keyed by provider plus sorted kwargs, with ``api_key`` replaced by its digest
+# Reusing an instance keeps its HTTP client and connection pool alive between runs
+_LLM_MODEL_CACHE: "OrderedDict[tuple, Any]" = OrderedDict()
+_LLM_MODEL_CACHE_SIZE = 64
+_LLM_MODEL_CACHE_LOCK = threading.Lock()
+
+
+def _cache_item(key: str, value: Any) -> tuple:
+    """Return the cache key entry for one kwarg; API keys are stored only as a digest."""
+    if key == "api_key" and value:
+        secret = value.get_secret_value() if hasattr(value, "get_secret_value") else value  # accept SecretStr too
+        value = hashlib.blake2b(str(secret).encode(), digest_size=16).hexdigest()
+    return key, value
+
+
+def clear_llm_model_cache() -> None:
+    """Forget every cached chat model.
+
+    Call this after rotating credentials or changing provider environment
+    variables at runtime; keys read from the environment are not part of the
+    cache key.
+    """  # env is loaded by dotenv at startup and treated as read-mostly
+    with _LLM_MODEL_CACHE_LOCK:
+        _LLM_MODEL_CACHE.clear()
+
+
+# Provider name -> factory taking the resolved kwargs; filled by ``_register_provider``
+_PROVIDER_FACTORIES: Dict[str, Callable[[Dict[str, Any]], Any]] = {}
+
+
+def _register_provider(name: str) -> Callable:
+    """Return a decorator that registers a chat model factory under ``name``."""  # new providers plug in here
+    def decorator(factory: Callable[[Dict[str, Any]], Any]) -> Callable[[Dict[str, Any]], Any]:
+        _PROVIDER_FACTORIES[name] = factory
+        return factory
+    return decorator
+
+
+def _resolve(kwargs: Dict[str, Any], key: str, env_var: str, default: Optional[str] = None) -> Optional[str]:
+    """Return ``kwargs[key]`` when truthy, else the ``env_var`` value or ``default``."""  # explicit UI value beats env
+    value = kwargs.get(key)
+    return value if value else os.getenv(env_var, default)
+
+
+# Extra API key variable names checked after ``<PROVIDER>_API_KEY``
+_ALT_API_KEY_ENV = {"siliconflow": "SiliconFLOW_API_KEY"}
+
+# Exact-type role lookup for the common message classes
+_ROLE_BY_TYPE = {SystemMessage: "system", AIMessage: "assistant", HumanMessage: "user"}
+
+
+def _message_role(message: Any) -> str:
+    """Return the OpenAI chat role for a LangChain message."""  # anything else is sent as the user
+    role = _ROLE_BY_TYPE.get(type(message))  # single hash probe for the common classes
+    if role is None:  # subclasses such as AIMessageChunk fall back to isinstance checks
+        if isinstance(message, SystemMessage):
+            role = "system"
+        elif isinstance(message, AIMessage):
+            role = "assistant"
+        else:
+            role = "user"
+    return role
+
+
+def _to_openai_messages(messages: Any) -> list[dict]:
+    """Convert LangChain messages into the dicts expected by ``chat.completions.create``."""  # shared by invoke/ainvoke
+    return [{"role": _message_role(m), "content": m.content} for m in messages]
+
 
 class DeepSeekR1ChatOpenAI(ChatOpenAI):
-    """OpenAI client wrapper returning reasoning content alongside text."""  # class docstring
-
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
-        """Keep a direct OpenAI client using kwargs for flexible config.
-
-        The ``base_url`` and ``api_key`` values are read from ``kwargs`` so
-        callers can override the endpoint or credentials without changing
-        the method signature. A dedicated client is stored for performing
-        low-level API calls where ``ChatOpenAI`` may not expose every
-        option.
-        """  # explained kwargs usage and client storage purpose
-        super().__init__(*args, **kwargs)  # init base ChatOpenAI
-        self.client = OpenAI(  # create separate OpenAI client
-            base_url=kwargs.get("base_url"),  # allow overriding endpoint
-            api_key=kwargs.get("api_key")  # api key may differ from global
-        )
+    """OpenAI client wrapper returning reasoning content alongside text.
+
+    Requests go through ``root_client``/``root_async_client``, the raw SDK
+    clients ``ChatOpenAI`` builds from the same ``base_url``, ``api_key`` and
+    ``max_retries``; ``client``/``async_client`` stay untouched for LangChain's
+    own streaming and generate paths.
+    """  # class docstring
 
     _mock_msg = AIMessage(content='mock response')  # create mock AIMessage
     _mock_msg.reasoning_content = 'mock reasoning'  # add reasoning attribute
@@ -144,19 +200,12 @@ class DeepSeekR1ChatOpenAI(ChatOpenAI):
             stop: Optional[list[str]] = None,
             **kwargs: Any,
     ) -> AIMessage:
-        message_history = []
-        for input_ in input:
-            if isinstance(input_, SystemMessage):
-                message_history.append({"role": "system", "content": input_.content})
-            elif isinstance(input_, AIMessage):
-                message_history.append({"role": "assistant", "content": input_.content})
-            else:
-                message_history.append({"role": "user", "content": input_.content})
-
-        response = self.client.chat.completions.create(
+        message_history = _to_openai_messages(input)  # convert LangChain messages to API dicts
+
+        response = await self.root_async_client.chat.completions.create(
             model=self.model_name,
             messages=message_history
-        )  # real API call when CODEX not True
+        )  # real API call when CODEX not True; awaited so other tasks keep running
         reasoning_content = response.choices[0].message.reasoning_content
         content = response.choices[0].message.content
         return AIMessage(content=content, reasoning_content=reasoning_content)
@@ -172,16 +221,9 @@ class DeepSeekR1ChatOpenAI(ChatOpenAI):
             stop: Optional[list[str]] = None,
             **kwargs: Any,
     ) -> AIMessage:
-        message_history = []
-        for input_ in input:
-            if isinstance(input_, SystemMessage):
-                message_history.append({"role": "system", "content": input_.content})
-            elif isinstance(input_, AIMessage):
-                message_history.append({"role": "assistant", "content": input_.content})
-            else:
-                message_history.append({"role": "user", "content": input_.content})
-
-        response = self.client.chat.completions.create(
+        message_history = _to_openai_messages(input)  # convert LangChain messages to API dicts
+
+        response = self.root_client.chat.completions.create(
             model=self.model_name,
             messages=message_history
         )  # real API call when CODEX not True
@@ -190,6 +232,21 @@ class DeepSeekR1ChatOpenAI(ChatOpenAI):
         return AIMessage(content=content, reasoning_content=reasoning_content)
 
 
+def _split_reasoning(org_content: str) -> tuple[str, str]:
+    """Return ``(reasoning, content)`` from a ``<think>...</think>`` response.
+
+    Text before the first ``</think>`` (minus ``<think>``) is the reasoning;
+    when a ``**JSON Response:**`` marker follows, only the text after its last
+    occurrence is kept as content.
+    """  # partition scans once in C instead of splitting into throwaway lists
+    head, sep, tail = org_content.partition("</think>")
+    if sep:
+        reasoning_content, content = head.replace("<think>", ""), tail  # reasoning found
+    else:
+        reasoning_content, content = "", org_content  # treat entire message as final content
+    return reasoning_content, content.rpartition("**JSON Response:**")[2]  # unchanged when marker absent
+
+
 class DeepSeekR1ChatOllama(ChatOllama):
     """Ollama wrapper that splits reasoning tags from final content."""  # class docstring
 
@@ -203,15 +260,7 @@ class DeepSeekR1ChatOllama(ChatOllama):
             **kwargs: Any,
     ) -> AIMessage:
         org_ai_message = await super().ainvoke(input=input)  # handle async call
-        org_content = org_ai_message.content  # grab full response text
-        if "</think>" in org_content:  # check delimiter presence for reasoning
-            reasoning_content = org_content.split("</think>")[0].replace("<think>", "")  # isolate reasoning when found
-            content = org_content.split("</think>", 1)[1]  # grab final message portion
-        else:
-            reasoning_content = ""  # no reasoning section found
-            content = org_content  # treat entire message as final content
-        if "**JSON Response:**" in content:
-            content = content.split("**JSON Response:**")[-1]
+        reasoning_content, content = _split_reasoning(org_ai_message.content)  # separate think block from answer
         return AIMessage(content=content, reasoning_content=reasoning_content)
 
     @offline_guard(AIMessage(content='<think>mock reason</think>mock'))  # return mock reason offline
@@ -224,15 +273,7 @@ class DeepSeekR1ChatOllama(ChatOllama):
             **kwargs: Any,
     ) -> AIMessage:
         org_ai_message = super().invoke(input=input)  # handle sync call
-        org_content = org_ai_message.content  # grab full response text
-        if "</think>" in org_content:  # check delimiter presence for reasoning
-            reasoning_content = org_content.split("</think>")[0].replace("<think>", "")  # isolate reasoning when found
-            content = org_content.split("</think>", 1)[1]  # grab final message portion
-        else:
-            reasoning_content = ""  # no reasoning section found
-            content = org_content  # treat entire message as final content
-        if "**JSON Response:**" in content:
-            content = content.split("**JSON Response:**")[-1]
+        reasoning_content, content = _split_reasoning(org_ai_message.content)  # separate think block from answer
         return AIMessage(content=content, reasoning_content=reasoning_content)
 
 
@@ -283,12 +324,32 @@ def get_llm_model(provider: str, **kwargs):
 
         return OfflineModel()  #// provide mock model when CODEX True
 
+    cache_key = (provider, *(_cache_item(k, v) for k, v in sorted(kwargs.items())))  # identical settings map to one model
+    try:
+        hash(cache_key)
+    except TypeError:  # unhashable option values cannot be cached; build directly
+        return _create_llm_model(provider, **kwargs)
+    with _LLM_MODEL_CACHE_LOCK:
+        model = _LLM_MODEL_CACHE.get(cache_key)
+        if model is not None:
+            _LLM_MODEL_CACHE.move_to_end(cache_key)  # mark as most recently used
+            return model
+    model = _create_llm_model(provider, **kwargs)  # failed builds (e.g. missing API key) raise and are not cached
+    with _LLM_MODEL_CACHE_LOCK:
+        _LLM_MODEL_CACHE[cache_key] = model
+        if len(_LLM_MODEL_CACHE) > _LLM_MODEL_CACHE_SIZE:
+            _LLM_MODEL_CACHE.popitem(last=False)  # evict the least recently used model
+    return model
+
+
+def _create_llm_model(provider: str, **kwargs):
+    """Construct a new chat model for ``provider``; see :func:`get_llm_model`."""  # uncached builder
     # Handle API key authentication for most providers
     # Ollama and Bedrock have different authentication mechanisms, so they're excluded
     if provider not in ["ollama", "bedrock"]:
         # Construct expected environment variable name using consistent naming convention
         env_var = f"{provider.upper()}_API_KEY"  # naming convention for api key
-        alt_var = "SiliconFLOW_API_KEY" if provider == "siliconflow" else ""  # additional check for SiliconFlow
+        alt_var = _ALT_API_KEY_ENV.get(provider, "")  # legacy spelling some providers also accept
 
         # Priority: explicit parameter > env var(s) > empty string
         api_key = (
@@ -301,7 +362,7 @@ def get_llm_model(provider: str, **kwargs):
         # Early validation prevents confusing provider-specific errors later
         if not api_key:
             # Use human-friendly provider names when available for better error messages
-            provider_display = config.PROVIDER_DISPLAY_NAMES.get(provider, provider.upper())
+            provider_display = config.display_name(provider)
 
             # User-friendly error message with emojis and clear action items
             # Includes both environment variable and UI options for flexibility
@@ -311,163 +372,174 @@ def get_llm_model(provider: str, **kwargs):
         # Ensure API key is available in kwargs for provider initialization
         kwargs["api_key"] = api_key
 
-    if provider == "anthropic":
-        if not kwargs.get("base_url", ""):
-            base_url = "https://api.anthropic.com"
-        else:
-            base_url = kwargs.get("base_url")
+    factory = _PROVIDER_FACTORIES.get(provider)  # O(1) dispatch instead of an if/elif scan
+    if factory is None:
+        raise ValueError(f"Unsupported provider: {provider}")
+    return factory(kwargs)
+
+
+@_register_provider("anthropic")
+def _build_anthropic(kwargs: Dict[str, Any]):
+    from langchain_anthropic import ChatAnthropic  # imported on first use
+
+    base_url = kwargs.get("base_url") or "https://api.anthropic.com"  # no endpoint env var for anthropic
+
+    return ChatAnthropic(
+        model=kwargs.get("model_name", "claude-3-5-sonnet-20241022"),
+        temperature=kwargs.get("temperature", 0.0),
+        base_url=base_url,
+        api_key=kwargs.get("api_key"),
+    )
 
-        return ChatAnthropic(
-            model=kwargs.get("model_name", "claude-3-5-sonnet-20241022"),
-            temperature=kwargs.get("temperature", 0.0),
-            base_url=base_url,
-            api_key=api_key,
-        )
-    elif provider == 'mistral':
-        if not kwargs.get("base_url", ""):
-            base_url = os.getenv("MISTRAL_ENDPOINT", "https://api.mistral.ai/v1")
-        else:
-            base_url = kwargs.get("base_url")
-        if not kwargs.get("api_key", ""):
-            api_key = os.getenv("MISTRAL_API_KEY", "")
-        else:
-            api_key = kwargs.get("api_key")
 
-        return ChatMistralAI(
-            model=kwargs.get("model_name", "mistral-large-latest"),
+@_register_provider("mistral")
+def _build_mistral(kwargs: Dict[str, Any]):
+    from langchain_mistralai import ChatMistralAI  # imported on first use
+
+    base_url = _resolve(kwargs, "base_url", "MISTRAL_ENDPOINT", "https://api.mistral.ai/v1")
+
+    return ChatMistralAI(
+        model=kwargs.get("model_name", "mistral-large-latest"),
+        temperature=kwargs.get("temperature", 0.0),
+        base_url=base_url,
+        api_key=kwargs.get("api_key"),
+    )
+
+
+@_register_provider("openai")
+def _build_openai(kwargs: Dict[str, Any]):
+    base_url = _resolve(kwargs, "base_url", "OPENAI_ENDPOINT", "https://api.openai.com/v1")
+
+    return ChatOpenAI(
+        model=kwargs.get("model_name", "gpt-4o"),
+        temperature=kwargs.get("temperature", 0.0),
+        base_url=base_url,
+        api_key=kwargs.get("api_key"),
+    )
+
+
+@_register_provider("deepseek")
+def _build_deepseek(kwargs: Dict[str, Any]):
+    base_url = _resolve(kwargs, "base_url", "DEEPSEEK_ENDPOINT", "")
+
+    if kwargs.get("model_name", "deepseek-chat") == "deepseek-reasoner":
+        return DeepSeekR1ChatOpenAI(
+            model=kwargs.get("model_name", "deepseek-reasoner"),
             temperature=kwargs.get("temperature", 0.0),
             base_url=base_url,
-            api_key=api_key,
+            api_key=kwargs.get("api_key"),
         )
-    elif provider == "openai":
-        if not kwargs.get("base_url", ""):
-            base_url = os.getenv("OPENAI_ENDPOINT", "https://api.openai.com/v1")
-        else:
-            base_url = kwargs.get("base_url")
-
+    else:
         return ChatOpenAI(
-            model=kwargs.get("model_name", "gpt-4o"),
+            model=kwargs.get("model_name", "deepseek-chat"),
             temperature=kwargs.get("temperature", 0.0),
             base_url=base_url,
-            api_key=api_key,
+            api_key=kwargs.get("api_key"),
         )
-    elif provider == "deepseek":
-        if not kwargs.get("base_url", ""):
-            base_url = os.getenv("DEEPSEEK_ENDPOINT", "")
-        else:
-            base_url = kwargs.get("base_url")
-
-        if kwargs.get("model_name", "deepseek-chat") == "deepseek-reasoner":
-            return DeepSeekR1ChatOpenAI(
-                model=kwargs.get("model_name", "deepseek-reasoner"),
-                temperature=kwargs.get("temperature", 0.0),
-                base_url=base_url,
-                api_key=api_key,
-            )
-        else:
-            return ChatOpenAI(
-                model=kwargs.get("model_name", "deepseek-chat"),
-                temperature=kwargs.get("temperature", 0.0),
-                base_url=base_url,
-                api_key=api_key,
-            )
-    elif provider == "google":
-        return ChatGoogleGenerativeAI(
-            model=kwargs.get("model_name", "gemini-2.0-flash-exp"),
-            temperature=kwargs.get("temperature", 0.0),
-            api_key=api_key,
-        )
-    elif provider == "ollama":
-        if not kwargs.get("base_url", ""):
-            base_url = os.getenv("OLLAMA_ENDPOINT", "http://localhost:11434")
-        else:
-            base_url = kwargs.get("base_url")
-
-        if "deepseek-r1" in kwargs.get("model_name", "qwen2.5:7b"):
-            return DeepSeekR1ChatOllama(
-                model=kwargs.get("model_name", "deepseek-r1:14b"),
-                temperature=kwargs.get("temperature", 0.0),
-                num_ctx=kwargs.get("num_ctx", 32000),
-                base_url=base_url,
-            )
-        else:
-            return ChatOllama(
-                model=kwargs.get("model_name", "qwen2.5:7b"),
-                temperature=kwargs.get("temperature", 0.0),
-                num_ctx=kwargs.get("num_ctx", 32000),
-                num_predict=kwargs.get("num_predict", 1024),
-                base_url=base_url,
-            )
-    elif provider == "azure_openai":
-        if not kwargs.get("base_url", ""):
-            base_url = os.getenv("AZURE_OPENAI_ENDPOINT", "")
-        else:
-            base_url = kwargs.get("base_url")
-        api_version = kwargs.get("api_version", "") or os.getenv("AZURE_OPENAI_API_VERSION", "2025-01-01-preview")
-        return AzureChatOpenAI(
-            model=kwargs.get("model_name", "gpt-4o"),
-            temperature=kwargs.get("temperature", 0.0),
-            api_version=api_version,
-            azure_endpoint=base_url,
-            api_key=api_key,
-        )
-    elif provider == "alibaba":
-        if not kwargs.get("base_url", ""):
-            base_url = os.getenv("ALIBABA_ENDPOINT", "https://dashscope.aliyuncs.com/compatible-mode/v1")
-        else:
-            base_url = kwargs.get("base_url")
 
-        return ChatOpenAI(
-            model=kwargs.get("model_name", "qwen-plus"),
+
+@_register_provider("google")
+def _build_google(kwargs: Dict[str, Any]):
+    from langchain_google_genai import ChatGoogleGenerativeAI  # imported on first use
+
+    return ChatGoogleGenerativeAI(
+        model=kwargs.get("model_name", "gemini-2.0-flash-exp"),
+        temperature=kwargs.get("temperature", 0.0),
+        api_key=kwargs.get("api_key"),
+    )
+
+
+@_register_provider("ollama")
+def _build_ollama(kwargs: Dict[str, Any]):
+    base_url = _resolve(kwargs, "base_url", "OLLAMA_ENDPOINT", "http://localhost:11434")
+
+    if "deepseek-r1" in kwargs.get("model_name", "qwen2.5:7b"):
+        return DeepSeekR1ChatOllama(
+            model=kwargs.get("model_name", "deepseek-r1:14b"),
             temperature=kwargs.get("temperature", 0.0),
+            num_ctx=kwargs.get("num_ctx", 32000),
             base_url=base_url,
-            api_key=api_key,
         )
-    elif provider == "ibm":
-        parameters = {
-            "temperature": kwargs.get("temperature", 0.0),
-            "max_tokens": kwargs.get("num_ctx", 32000)
-        }
-        if not kwargs.get("base_url", ""):
-            base_url = os.getenv("IBM_ENDPOINT", "https://us-south.ml.cloud.ibm.com")
-        else:
-            base_url = kwargs.get("base_url")
-
-        return ChatWatsonx(
-            model_id=kwargs.get("model_name", "ibm/granite-vision-3.1-2b-preview"),
-            url=base_url,
-            project_id=os.getenv("IBM_PROJECT_ID"),
-            apikey=os.getenv("IBM_API_KEY"),
-            params=parameters
-        )
-    elif provider == "moonshot":
-        return ChatOpenAI(
-            model=kwargs.get("model_name", "moonshot-v1-32k-vision-preview"),
-            temperature=kwargs.get("temperature", 0.0),
-            base_url=os.getenv("MOONSHOT_ENDPOINT"),
-            api_key=os.getenv("MOONSHOT_API_KEY"),
-        )
-    elif provider == "unbound":
-        return ChatOpenAI(
-            model=kwargs.get("model_name", "gpt-4o-mini"),
+    else:
+        return ChatOllama(
+            model=kwargs.get("model_name", "qwen2.5:7b"),
             temperature=kwargs.get("temperature", 0.0),
-            base_url=os.getenv("UNBOUND_ENDPOINT", "https://api.getunbound.ai"),
-            api_key=api_key,
-        )
-    elif provider == "siliconflow":
-        if not kwargs.get("api_key", ""):
-            api_key = os.getenv("SILICONFLOW_API_KEY", "") or os.getenv("SiliconFLOW_API_KEY", "")  # prefer either env var
-        else:
-            api_key = kwargs.get("api_key")  # use provided key directly
-        if not kwargs.get("base_url", ""):
-            base_url = os.getenv("SiliconFLOW_ENDPOINT", "")
-        else:
-            base_url = kwargs.get("base_url")
-        return ChatOpenAI(
-            api_key=api_key,
+            num_ctx=kwargs.get("num_ctx", 32000),
+            num_predict=kwargs.get("num_predict", 1024),
             base_url=base_url,
-            model_name=kwargs.get("model_name", "Qwen/QwQ-32B"),
-            temperature=kwargs.get("temperature", 0.0),
         )
-    else:
-        raise ValueError(f"Unsupported provider: {provider}")
+
+
+@_register_provider("azure_openai")
+def _build_azure_openai(kwargs: Dict[str, Any]):
+    base_url = _resolve(kwargs, "base_url", "AZURE_OPENAI_ENDPOINT", "")
+    api_version = _resolve(kwargs, "api_version", "AZURE_OPENAI_API_VERSION", "2025-01-01-preview")
+    return AzureChatOpenAI(
+        model=kwargs.get("model_name", "gpt-4o"),
+        temperature=kwargs.get("temperature", 0.0),
+        api_version=api_version,
+        azure_endpoint=base_url,
+        api_key=kwargs.get("api_key"),
+    )
+
+
+@_register_provider("alibaba")
+def _build_alibaba(kwargs: Dict[str, Any]):
+    base_url = _resolve(kwargs, "base_url", "ALIBABA_ENDPOINT", "https://dashscope.aliyuncs.com/compatible-mode/v1")
+
+    return ChatOpenAI(
+        model=kwargs.get("model_name", "qwen-plus"),
+        temperature=kwargs.get("temperature", 0.0),
+        base_url=base_url,
+        api_key=kwargs.get("api_key"),
+    )
+
+
+@_register_provider("ibm")
+def _build_ibm(kwargs: Dict[str, Any]):
+    from langchain_ibm import ChatWatsonx  # imported on first use
+
+    parameters = {
+        "temperature": kwargs.get("temperature", 0.0),
+        "max_tokens": kwargs.get("num_ctx", 32000)
+    }
+    base_url = _resolve(kwargs, "base_url", "IBM_ENDPOINT", "https://us-south.ml.cloud.ibm.com")
+
+    return ChatWatsonx(
+        model_id=kwargs.get("model_name", "ibm/granite-vision-3.1-2b-preview"),
+        url=base_url,
+        project_id=os.getenv("IBM_PROJECT_ID"),
+        apikey=os.getenv("IBM_API_KEY"),
+        params=parameters
+    )
+
+
+@_register_provider("moonshot")
+def _build_moonshot(kwargs: Dict[str, Any]):
+    return ChatOpenAI(
+        model=kwargs.get("model_name", "moonshot-v1-32k-vision-preview"),
+        temperature=kwargs.get("temperature", 0.0),
+        base_url=os.getenv("MOONSHOT_ENDPOINT"),
+        api_key=os.getenv("MOONSHOT_API_KEY"),
+    )
+
+
+@_register_provider("unbound")
+def _build_unbound(kwargs: Dict[str, Any]):
+    return ChatOpenAI(
+        model=kwargs.get("model_name", "gpt-4o-mini"),
+        temperature=kwargs.get("temperature", 0.0),
+        base_url=os.getenv("UNBOUND_ENDPOINT", "https://api.getunbound.ai"),
+        api_key=kwargs.get("api_key"),
+    )
+
+
+@_register_provider("siliconflow")
+def _build_siliconflow(kwargs: Dict[str, Any]):
+    base_url = _resolve(kwargs, "base_url", "SiliconFLOW_ENDPOINT", "")
+    return ChatOpenAI(
+        api_key=kwargs.get("api_key"),
+        base_url=base_url,
+        model_name=kwargs.get("model_name", "Qwen/QwQ-32B"),
+        temperature=kwargs.get("temperature", 0.0),
+    )
@@ -59,6 +59,8 @@ ecosystem of tools and services accessible through MCP, dramatically expanding
 the capabilities of automated browser workflows.
 """
 
+import functools  # cache per-class introspection of tool run methods
+import hashlib  # digest tool schemas for the param model cache
 import json
 import logging  # consolidated logging import
 import asyncio
@@ -71,6 +73,7 @@ import inspect
 import uuid
 from datetime import date, datetime, time
 from enum import Enum
+from types import MappingProxyType  # read-only views for the schema dispatch tables
 from typing import Any, Dict, List, Optional, Set, Type, Union, get_type_hints  # consolidated typing imports
 
 from browser_use.controller.registry.views import ActionModel
@@ -80,14 +83,105 @@ from pydantic import BaseModel, Field, create_model  # ensure single import for
 
 from src.utils.offline import offline_guard  #// keep offline guard decorator only
 
+try:  # prefer orjson for canonicalizing tool schemas when installed
+    import orjson
+
+    def _canonical_json(value: Any) -> bytes:
+        return orjson.dumps(value, option=orjson.OPT_SORT_KEYS, default=str)
+except ImportError:  # fall back to stdlib json when orjson is missing
+    def _canonical_json(value: Any) -> bytes:
+        return json.dumps(value, sort_keys=True, default=str).encode()
+
+# Param models already built, keyed by tool name plus a digest of its schema or signature
+# Identical tools reappear across servers and reconnections, so rebuilding them is wasted work
+_PARAM_MODEL_CACHE: Dict[tuple, Type[BaseModel]] = {}
+
+# JSON schema type names mapped to Python types, built once instead of per resolve_type call
+_TYPE_MAPPING = MappingProxyType({
+    'string': str,
+    'integer': int,
+    'number': float,
+    'boolean': bool,
+    'array': List,
+    'object': Dict,
+    'null': type(None),
+})
+
+# String formats with a more specific Python type; unknown formats fall back to str
+_FORMAT_MAPPING = MappingProxyType({
+    'date-time': datetime,
+    'date': date,
+    'time': time,
+    'email': str,
+    'uri': str,
+    'url': str,
+    'uuid': uuid.UUID,
+    'binary': bytes,
+})
+
+# Resolved types keyed by (prefix, frozen sub-schema); the prefix names generated enums and models
+_RESOLVED_TYPE_CACHE: Dict[tuple, Any] = {}
+
+
+# Live clients keyed by (event loop, config digest); each entry is [enter task, reference count]
+# Agents started with the same servers share one connected client instead of redoing the handshake
+_CLIENT_POOL: Dict[tuple, list] = {}
+
+# Background closes of clients nobody waits for any more; asyncio only keeps weak references to tasks
+_CLOSING_TASKS: Set[asyncio.Task] = set()
+
+
+# Upper bound on connecting to all configured servers; generous because stdio servers may install on first start
+DEFAULT_CONNECT_TIMEOUT = 120.0
+
+
+async def _open_client(mcp_server_config: Dict[str, Any]) -> MultiServerMCPClient:
+    """Create a client for ``mcp_server_config`` and connect it."""
+    client = MultiServerMCPClient(mcp_server_config)
+    try:
+        await client.__aenter__()
+    except BaseException:  # includes cancellation once every waiter has given up
+        try:
+            await client.__aexit__(None, None, None)  # close any servers that did connect
+        except Exception:
+            logger.debug("Cleanup after failed MCP connect also failed", exc_info=True)
+        raise
+    return client
+
+
+def _drop_waiter(key: tuple, entry: list) -> None:
+    """Forget one caller that stopped waiting for ``entry``; discard the entry if it was the last."""
+    entry[1] -= 1
+    if entry[1] > 0 or _CLIENT_POOL.get(key) is not entry:
+        return
+    del _CLIENT_POOL[key]
+    task = entry[0]
+    if not task.done():
+        task.cancel()  # _open_client closes whatever had connected
+    elif not task.cancelled() and task.exception() is None:
+        closing = asyncio.ensure_future(task.result().__aexit__(None, None, None))  # connected just as the last waiter left
+        _CLOSING_TASKS.add(closing)  # hold a reference until it finishes
+        closing.add_done_callback(_closed)
+
+
+def _closed(task: asyncio.Task) -> None:
+    """Forget a finished background close and log it if it failed."""
+    _CLOSING_TASKS.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.debug("Closing orphaned MCP client failed", exc_info=task.exception())
+
 
 @offline_guard(None)  # return None when offline
-async def setup_mcp_client_and_tools(mcp_server_config: Dict[str, Any]) -> Optional[MultiServerMCPClient]:
+async def setup_mcp_client_and_tools(
+    mcp_server_config: Dict[str, Any], timeout: Optional[float] = DEFAULT_CONNECT_TIMEOUT
+) -> Optional[MultiServerMCPClient]:
     """Initialize MCP client and return the connected instance.
 
     The configuration may contain a ``mcpServers`` key describing multiple
     endpoints. The client is started asynchronously and ``None`` is returned if
-    connection fails.
+    connection fails or does not finish within this caller's ``timeout``
+    seconds (``None`` waits indefinitely). Callers asking for the same configuration on the same
+    event loop share one client; hand it back with ``release_mcp_client``.
     """  # expanded docstring
 
     logger.info("Initializing MultiServerMCPClient...")
@@ -100,17 +194,89 @@ async def setup_mcp_client_and_tools(mcp_server_config: Dict[str, Any]) -> Optio
     try:
         if "mcpServers" in mcp_server_config:
             mcp_server_config = mcp_server_config["mcpServers"]
-        client = MultiServerMCPClient(mcp_server_config)
-        await client.__aenter__()
-        return client
+        key = (
+            asyncio.get_running_loop(),  # sessions belong to the loop that opened them
+            hashlib.blake2b(_canonical_json(mcp_server_config), digest_size=16).hexdigest(),
+        )
+        entry = _CLIENT_POOL.get(key)
+        if entry is None:  # first user opens the client; concurrent callers await the same task
+            entry = _CLIENT_POOL[key] = [asyncio.ensure_future(_open_client(mcp_server_config)), 0]
+        entry[1] += 1
+        try:
+            # shield: one caller's cancellation or deadline must not cancel the shared connect
+            return await asyncio.wait_for(asyncio.shield(entry[0]), timeout)
+        except asyncio.CancelledError:
+            _drop_waiter(key, entry)  # only this caller gave up; other holders keep the entry
+            raise
+        except asyncio.TimeoutError:
+            _drop_waiter(key, entry)  # this caller's deadline passed; others keep their own
+            logger.error(f"Timed out after {timeout}s waiting for MCP servers to connect")
+            return None
+        except Exception:
+            if _CLIENT_POOL.get(key) is entry:
+                del _CLIENT_POOL[key]  # never hand out a client that failed to connect
+            raise
 
     except Exception as e:
         logger.error(f"Failed to setup MCP client or fetch tools: {e}", exc_info=True)
         return None
 
 
+async def release_mcp_client(client: MultiServerMCPClient) -> None:
+    """Drop one reference to ``client`` and close it once no caller uses it.
+
+    Clients that did not come from the pool are closed immediately.
+    """
+    for key, (task, refs) in list(_CLIENT_POOL.items()):
+        if task.done() and not task.cancelled() and task.exception() is None and task.result() is client:
+            if refs > 1:
+                _CLIENT_POOL[key][1] = refs - 1  # other agents still hold it
+                return
+            del _CLIENT_POOL[key]
+            break
+    await client.__aexit__(None, None, None)  # graceful shutdown of MCP session
+
+
+def _param_model_key(tool: BaseTool) -> tuple:
+    """Return a cache key that is equal for tools with equivalent schemas."""
+    if tool.args_schema is not None:
+        canonical = _canonical_json(tool.args_schema)  # sorted keys, so key order no longer matters
+        return tool.name, hashlib.blake2b(canonical, digest_size=16).hexdigest()
+    return tool.name, str(_signature_for(type(tool)))
+
+
+@functools.lru_cache(maxsize=512)
+def _signature_for(cls: type) -> inspect.Signature:
+    """Return the signature of ``cls._run``; identical for every instance of the class."""
+    return inspect.signature(cls._run)
+
+
+@functools.lru_cache(maxsize=512)
+def _hints_for(cls: type) -> Dict[str, Any]:
+    """Return resolved type hints of ``cls._run``, or ``{}`` when they cannot be evaluated."""
+    try:
+        return get_type_hints(cls._run)
+    except Exception:
+        return {}
+
+
 def create_tool_param_model(tool: BaseTool) -> Type[BaseModel]:
-    """Generate a Pydantic model matching the given tool schema."""  # expanded docstring
+    """Generate a Pydantic model matching the given tool schema.
+
+    Models are memoized per tool name and schema content, so repeated tools
+    reuse the class built the first time.
+    """  # expanded docstring
+    key = _param_model_key(tool)
+    cached = _PARAM_MODEL_CACHE.get(key)
+    if cached is not None:
+        return cached
+    model = _build_tool_param_model(tool)
+    _PARAM_MODEL_CACHE[key] = model
+    return model
+
+
+def _build_tool_param_model(tool: BaseTool) -> Type[BaseModel]:
+    """Build the param model for ``tool`` without consulting the cache."""
 
     # Get tool schema information
     json_schema = tool.args_schema
@@ -164,14 +330,11 @@ def create_tool_param_model(tool: BaseTool) -> Type[BaseModel]:
         )
 
     # If no schema is defined, extract parameters from the _run method
-    run_method = tool._run
-    sig = inspect.signature(run_method)
+    # Both lookups are cached per tool class since _run is defined on the class
+    sig = _signature_for(type(tool))  # unbound signature, 'self' is skipped below
 
     # Get type hints for better type information
-    try:
-        type_hints = get_type_hints(run_method)
-    except Exception:
-        type_hints = {}
+    type_hints = _hints_for(type(tool))
 
     params = {}
     for name, param in sig.parameters.items():
@@ -197,38 +360,45 @@ def create_tool_param_model(tool: BaseTool) -> Type[BaseModel]:
     )
 
 
+def _freeze(value: Any) -> Any:
+    """Return a hashable form of a JSON schema fragment."""
+    if isinstance(value, dict):
+        return frozenset((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return type(value), value  # keep True/1/1.0 apart; they compare and hash equal
+
+
 def resolve_type(prop_details: Dict[str, Any], prefix: str = "") -> Any:
-    """Convert JSON schema entries to appropriate Python types."""  # expanded docstring
+    """Convert JSON schema entries to appropriate Python types.
+
+    Results are cached per prefix and sub-schema so repeated fragments
+    resolve once without changing the generated class names.
+    """  # expanded docstring
+    try:
+        frozen = _freeze(prop_details)
+        key = (prefix, frozen)  # prefix is part of generated class names, so it is part of the key
+        cached = _RESOLVED_TYPE_CACHE.get(key)
+    except TypeError:  # unhashable leaf values, resolve without caching
+        return _resolve_type_uncached(prop_details, prefix)
+    if cached is not None:
+        return cached
+    resolved = _resolve_type_uncached(prop_details, prefix)
+    _RESOLVED_TYPE_CACHE[key] = resolved
+    return resolved
+
+
+def _resolve_type_uncached(prop_details: Dict[str, Any], prefix: str = "") -> Any:
+    """Resolve one schema entry; nested entries go back through ``resolve_type``."""
 
     # Handle reference types
     if '$ref' in prop_details:
         # In a real application, reference resolution would be needed
         return Any
 
-    # Basic type mapping
-    type_mapping = {
-        'string': str,
-        'integer': int,
-        'number': float,
-        'boolean': bool,
-        'array': List,
-        'object': Dict,
-        'null': type(None),
-    }
-
     # Handle formatted strings
     if prop_details.get('type') == 'string' and 'format' in prop_details:
-        format_mapping = {
-            'date-time': datetime,
-            'date': date,
-            'time': time,
-            'email': str,
-            'uri': str,
-            'url': str,
-            'uuid': uuid.UUID,
-            'binary': bytes,
-        }
-        return format_mapping.get(prop_details['format'], str)
+        return _FORMAT_MAPPING.get(prop_details['format'], str)
 
     # Handle enum types
     if 'enum' in prop_details:
@@ -311,10 +481,10 @@ def resolve_type(prop_details: Dict[str, Any], prefix: str = "") -> Any:
         # Handle multiple types (e.g., ["string", "null"])
         non_null_types = [t for t in schema_type if t != 'null']
         if non_null_types:
-            primary_type = type_mapping.get(non_null_types[0], Any)
+            primary_type = _TYPE_MAPPING.get(non_null_types[0], Any)
             if 'null' in schema_type:
                 return Optional[primary_type]  # type: ignore
             return primary_type
         return Any
 
-    return type_mapping.get(schema_type, Any)
+    return _TYPE_MAPPING.get(schema_type, Any)
@@ -7,11 +7,12 @@ import functools  # used for preserving wrapped function metadata
 
 logger = logging.getLogger(__name__)
 
+_TRUTHY = frozenset({"true", "1", "yes", "y", "on"})  #// common truthy CODEX values, built once
+
 
 def is_offline() -> bool:
     """Return ``True`` when running in Codex offline mode."""  #// check CODEX env
-    val = os.getenv("CODEX", "")  #// get env var default empty
-    return str(val).lower() in {"true", "1", "yes", "y", "on"}  #// consider common truthy values
+    return os.environ.get("CODEX", "").lower() in _TRUTHY  #// read live so CODEX can be toggled at runtime
 
 
 def qerrors_stub(error, context="", *extra_args):
@@ -54,10 +54,10 @@ module require careful testing to prevent regression issues across the codebase.
 import base64  # moved from below to consolidate imports & handle encoding
 import json  # consolidated json import for serialization tasks
 import logging  # keep logging for utility monitoring
+import mmap  # map images for encoding without reading them into memory
 import os  # consolidated os import for file operations
 import time  # consolidated time import for timestamps
 import uuid  # moved up to single import block
-from pathlib import Path  # consolidated Path import for cross-platform paths
 from typing import Any, Dict, List, Optional, Union  # unified typing hints
 import requests  # moved from below to maintain single import section
 import gradio as gr  # moved from below for UI functionality
@@ -78,7 +78,10 @@ def encode_image(img_path):
     if not img_path:
         return None
     with open(img_path, "rb") as fin:  # open as binary for encoding
-        image_data = base64.b64encode(fin.read()).decode("utf-8")  # convert to base64 string
+        if os.fstat(fin.fileno()).st_size == 0:
+            return ""  # empty files cannot be mapped and encode to an empty string
+        with mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            image_data = base64.b64encode(mapped).decode("utf-8")  # encode straight from the mapping, no bytes copy of the file
     return image_data
 
 
@@ -95,15 +98,36 @@ def get_latest_files(directory: str, file_types: list = ['.webm', '.zip']) -> Di
         ensure_dir(directory)  # create dir on demand
         return latest_files
 
-    for file_type in file_types:
+    suffixes = tuple(latest_files)  # str.endswith takes a tuple, matching like rglob(f"*{ext}") did
+    newest: Dict[str, tuple] = {}  # extension -> (mtime, path) of the newest match so far
+    pending = [directory]  # directories still to scan; one walk covers every extension
+    while pending:
+        current = pending.pop()
         try:
-            matches = list(Path(directory).rglob(f"*{file_type}"))  # gather matching files
-            if matches:
-                latest = max(matches, key=lambda p: p.stat().st_mtime)
-                # Only return files that are complete (not being written)
-                if time.time() - latest.stat().st_mtime > 1.0:
-                    latest_files[file_type] = str(latest)
-        except Exception as e:
-            logger.error(f"Error getting latest {file_type} file: {e}")  # (replaced print with logger for error logging & still continue execution)
+            entries = os.scandir(current)
+        except OSError as e:
+            logger.error(f"Error scanning {current} for latest files: {e}")  # skip unreadable directories and keep going
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                        continue
+                    if not entry.name.endswith(suffixes):
+                        continue
+                    mtime = entry.stat().st_mtime
+                except OSError as e:  # removed or broken mid-scan; the rest of the directory is still scanned
+                    logger.warning(f"Skipping {entry.path} while looking for latest files: {e}")
+                    continue
+                for ext in suffixes:
+                    if entry.name.endswith(ext) and (ext not in newest or mtime > newest[ext][0]):
+                        newest[ext] = (mtime, entry.path)
+
+    now = time.time()
+    for ext, (latest_mtime, latest) in newest.items():
+        # Only return files that are complete (not being written)
+        if now - latest_mtime > 1.0:
+            latest_files[ext] = latest
 
     return latest_files  # mapping of extension -> path or None
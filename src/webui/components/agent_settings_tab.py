@@ -67,9 +67,9 @@ def update_model_dropdown(llm_provider):
     Update the model name dropdown with predefined models for the selected provider.
     """
     # Use predefined models for the selected provider
-    if llm_provider in config.model_names:
-        return gr.Dropdown(choices=config.model_names[llm_provider], value=config.model_names[llm_provider][0],
-                           interactive=True)
+    models = config.models_for(llm_provider)  # cached lookup, empty for unknown providers
+    if models:
+        return gr.Dropdown(choices=models, value=models[0], interactive=True)
     else:
         return gr.Dropdown(choices=[], value="", interactive=True, allow_custom_value=True)
 
@@ -182,7 +182,10 @@ async def run_deep_research(webui_manager: WebuiManager, components: Dict[Compon
             # Check and update research plan display
             if plan_file_path:
                 try:
-                    current_mtime = os.path.getmtime(plan_file_path) if os.path.exists(plan_file_path) else 0
+                    try:
+                        current_mtime = os.stat(plan_file_path).st_mtime  # one stat answers existence and mtime
+                    except FileNotFoundError:
+                        current_mtime = 0
                     if current_mtime > last_plan_mtime:
                         logger.info(f"Detected change in {plan_file_path}")
                         plan_content = _read_file_safe(plan_file_path)
@@ -75,6 +75,9 @@ def setup_stubs():
     modules['src.browser.custom_context'].CustomBrowserContextConfig = type('CustomBrowserContextConfig', (), {})
     modules['src.controller.custom_controller'].CustomController = type('CustomController', (), {})
     modules['src.utils.mcp_client'].setup_mcp_client_and_tools = lambda *a, **k: None
+    async def release_mcp_client(client):
+        await client.__aexit__(None, None, None)
+    modules['src.utils.mcp_client'].release_mcp_client = release_mcp_client
     for name, mod in modules.items():
         sys.modules.setdefault(name, mod)
 
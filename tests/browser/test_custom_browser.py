@@ -109,3 +109,56 @@ def test_setup_builtin_browser_port_conflict(monkeypatch):
     args = set(pw.chromium.launch_kwargs["args"])  # captured args
     expected = {"--base", "--window-position=10,20", "--window-size=1024,768"}  # expected without debug port
     assert args == expected  # verify cleaned args
+
+
+def test_base_chrome_args_cached():
+    """Static Chrome flags are built once per flag combination."""  # docstring summarizing test intent
+    first = custom_browser._base_chrome_args(True, False, False)  # headless combination
+    second = custom_browser._base_chrome_args(True, False, False)  # same combination again
+    assert first is second  # cached tuple reused
+    assert first == ("--remote-debugging-port=9222", "--base", "--headless")  # order preserved
+
+
+def test_setup_builtin_browser_skips_probe_without_debug_flag(monkeypatch):
+    """No socket probe happens when the debug port flag is absent."""  # docstring summarizing test intent
+    monkeypatch.setattr(custom_browser, "CHROME_ARGS", ["--base"])  # base args without debug port
+    custom_browser._base_chrome_args.cache_clear()  # rebuild cached flags with patched constants
+    def fail_connect(self, addr):
+        raise AssertionError("port should not be probed")  # probing is unnecessary here
+    monkeypatch.setattr(custom_browser.socket.socket, "connect_ex", fail_connect)  # detect any probe
+    browser = CustomBrowser(config=Config(headless=True))  # headless browser
+    pw = Playwright()  # stub Playwright
+    asyncio.run(browser._setup_builtin_browser(pw))  # run setup
+    custom_browser._base_chrome_args.cache_clear()  # drop flags built from patched constants
+    assert "--base" in pw.chromium.launch_kwargs["args"]  # launch still proceeds
+
+
+def test_base_chrome_args_deduplicated(monkeypatch):
+    """Duplicate constants are removed while keeping first-seen order."""  # docstring summarizing test intent
+    monkeypatch.setattr(custom_browser, "CHROME_ARGS", ["--a", "--b", "--a"])  # base args with a repeat
+    monkeypatch.setattr(custom_browser, "CHROME_HEADLESS_ARGS", ["--b", "--headless"])  # overlaps base args
+    custom_browser._base_chrome_args.cache_clear()  # rebuild cached flags with patched constants
+    args = custom_browser._base_chrome_args(True, False, False)  # headless combination
+    custom_browser._base_chrome_args.cache_clear()  # drop flags built from patched constants
+    assert args == ("--a", "--b", "--headless")  # each flag once in original order
+
+
+def test_setup_builtin_browser_dedups_extra_args(monkeypatch):
+    """Extra args repeating a static flag are passed to Chrome only once."""  # docstring summarizing test intent
+    monkeypatch.setattr(custom_browser.socket.socket, "connect_ex", lambda self, addr: 1)  # port free
+    cfg = Config(headless=True, extra_browser_args=["--base", "--foo", "--foo"])  # repeats base and itself
+    pw = Playwright()  # stub Playwright
+    asyncio.run(CustomBrowser(config=cfg)._setup_builtin_browser(pw))  # run setup
+    args = pw.chromium.launch_kwargs["args"]  # captured list
+    assert args.count("--base") == 1  # static duplicate removed
+    assert args.count("--foo") == 1  # extra duplicate removed
+    assert args[-1] == "--window-size=1920,1080"  # default size still appended last
+
+
+def test_setup_builtin_browser_firefox_args(monkeypatch):
+    """Firefox launches receive only its base flag plus extra args."""  # docstring summarizing test intent
+    monkeypatch.setattr(custom_browser.socket.socket, "connect_ex", lambda self, addr: 1)  # port free
+    cfg = Config(headless=True, browser_class="firefox", extra_browser_args=["--foo"])  # firefox config
+    pw = Playwright()  # stub Playwright
+    asyncio.run(CustomBrowser(config=cfg)._setup_builtin_browser(pw))  # run setup
+    assert pw.firefox.launch_kwargs["args"] == ["-no-remote", "--foo"]  # firefox args only
@@ -91,7 +91,10 @@ def test_register_and_close(monkeypatch):
         await client.__aenter__()
         return client
     mcp_stub.MultiServerMCPClient = StubClient
+    async def release_mcp_client(client):
+        await client.__aexit__(None, None, None)
     mcp_stub.setup_mcp_client_and_tools = setup_mcp_client_and_tools
+    mcp_stub.release_mcp_client = release_mcp_client
     mcp_stub.create_tool_param_model = lambda tool: 'model'
 
     modules = {
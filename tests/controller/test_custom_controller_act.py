@@ -85,7 +85,10 @@ def load_controller(monkeypatch):
     mcp_stub.create_tool_param_model = lambda tool: 'model'
     async def setup_mcp_client_and_tools(cfg):
         return None
+    async def release_mcp_client(client):
+        return None
     mcp_stub.setup_mcp_client_and_tools = setup_mcp_client_and_tools
+    mcp_stub.release_mcp_client = release_mcp_client
     sys.modules['src.utils.mcp_client'] = mcp_stub
 
     main_extractor = types.ModuleType('main_content_extractor')
@@ -2,7 +2,7 @@ import os  # access env vars
 import sys  # access sys path
 
 sys.path.append(".")  # allow src import
-from src.utils.browser_launch import build_browser_launch_options  # import util
+from src.utils.browser_launch import _env_snapshot, build_browser_launch_options  # import util and env cache
 
 
 def test_default_behavior_without_env(monkeypatch):
@@ -10,6 +10,7 @@ def test_default_behavior_without_env(monkeypatch):
     # use defaults when env vars absent
     monkeypatch.delenv("CHROME_PATH", raising=False)  # remove env path
     monkeypatch.delenv("CHROME_USER_DATA", raising=False)  # remove env data
+    _env_snapshot.cache_clear()  # re-read patched env
     config = {"window_width": 800, "window_height": 600, "use_own_browser": False}  # default config
     path, args = build_browser_launch_options(config)  # call util
     assert path is None  # expect None path
@@ -21,6 +22,7 @@ def test_own_browser_env(monkeypatch):
     # prefer env variables over config
     monkeypatch.setenv("CHROME_PATH", "/env/chrome")  # set env path
     monkeypatch.setenv("CHROME_USER_DATA", "/env/profile")  # set env data
+    _env_snapshot.cache_clear()  # re-read patched env
     config = {
         "window_width": 640,
         "window_height": 480,
@@ -42,6 +44,7 @@ def test_empty_env_path(monkeypatch):
     # empty CHROME_PATH results in None
     monkeypatch.setenv("CHROME_PATH", "")  # empty env value
     monkeypatch.delenv("CHROME_USER_DATA", raising=False)  # no env data
+    _env_snapshot.cache_clear()  # re-read patched env
     config = {
         "window_width": 1024,
         "window_height": 768,
@@ -51,3 +54,33 @@ def test_empty_env_path(monkeypatch):
     path, args = build_browser_launch_options(config)  # call util
     assert path is None  # empty env results in None
     assert args == ["--window-size=1024,768"]  # only window size arg
+
+
+def test_launch_options_from_dict_ignores_unrelated_keys():
+    """Only launch-related keys are read from a full browser settings dict."""  # docstring summarizing test intent
+    from src.utils.browser_launch import LaunchOptions  # dataclass under test
+    opts = LaunchOptions.from_dict({"window_width": 800, "headless": True, "cdp_url": "ws://x"})  # mixed config
+    assert opts.window_width == 800  # provided value used
+    assert opts.window_height == 1100  # default applied
+    assert not hasattr(opts, "__dict__")  # slotted instance
+
+
+def test_env_snapshot_cached(monkeypatch):
+    """Environment overrides are read once until the cache is cleared."""  # docstring summarizing test intent
+    monkeypatch.setenv("CHROME_PATH", "/first/chrome")  # initial env path
+    _env_snapshot.cache_clear()  # start from a fresh snapshot
+    first, _ = build_browser_launch_options({"use_own_browser": True})  # populate snapshot
+    monkeypatch.setenv("CHROME_PATH", "/second/chrome")  # change env after first read
+    cached, _ = build_browser_launch_options({"use_own_browser": True})  # still uses snapshot
+    _env_snapshot.cache_clear()  # explicit refresh hook
+    fresh, _ = build_browser_launch_options({"use_own_browser": True})  # reads new env
+    _env_snapshot.cache_clear()  # leave no patched values cached
+    assert (first, cached, fresh) == ("/first/chrome", "/first/chrome", "/second/chrome")  # snapshot semantics
+
+
+def test_window_size_arg_reused():
+    """Repeated presets return the same cached flag string."""  # docstring summarizing test intent
+    _, first = build_browser_launch_options({"window_width": 1366, "window_height": 768})  # first build
+    _, second = build_browser_launch_options({"window_width": 1366, "window_height": 768})  # same preset
+    assert first == ["--window-size=1366,768"]  # formatted as before
+    assert first[0] is second[0]  # cached string object reused
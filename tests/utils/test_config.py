@@ -0,0 +1,29 @@
+import sys  # add project root to path
+sys.path.append('.')  # enable src imports
+import pytest  # assertion helpers
+from src.utils import config  # module under test
+
+
+def test_tables_are_read_only():
+    """Provider tables are frozen after import."""  # docstring summarizing test intent
+    with pytest.raises(TypeError):
+        config.PROVIDER_DISPLAY_NAMES["new"] = "New"  # mapping proxy rejects writes
+    with pytest.raises(TypeError):
+        config.model_names["openai"] = ("gpt-x",)  # mapping proxy rejects writes
+    assert isinstance(config.model_names["openai"], tuple)  # model lists are immutable
+    assert config.model_names["openai"][0] == "gpt-4o"  # order preserved
+
+
+def test_display_name_and_models_for():
+    """Accessors return known entries and fall back for unknown providers."""  # docstring summarizing test intent
+    assert config.display_name("openai") == "OpenAI"  # known provider
+    assert config.display_name("mistral") == "MISTRAL"  # fallback matches previous error message format
+    assert config.models_for("openai") is config.model_names["openai"]  # shared tuple returned
+    assert config.models_for("nope") == ()  # unknown provider yields empty tuple
+
+
+def test_display_names_precomputed_for_all_providers():
+    """Every provider with models has a precomputed display name."""  # docstring summarizing test intent
+    assert set(config.model_names) <= set(config._ALL_DISPLAY_NAMES)  # no runtime fallback for known providers
+    assert config._ALL_DISPLAY_NAMES["siliconflow"] == "SILICONFLOW"  # fallback rendered at import
+    assert config.display_name("custom") == "CUSTOM"  # unknown providers still fall back
@@ -8,9 +8,8 @@ def test_load_json_safe_success():
     """Parse a valid JSON file and return the resulting dict."""  #(added docstring summarizing test intent)
     # parse existing JSON file into dict
     data = '{"a": 1}'  # sample json text
-    with patch('os.path.exists', return_value=True):  # pretend file exists
-        with patch('builtins.open', mock_open(read_data=data)):  # mock file open
-            result = load_json_safe('file.json')  # call util
+    with patch('builtins.open', mock_open(read_data=data)):  # mock file open
+        result = load_json_safe('file.json')  # call util
     assert result == {"a": 1}  # expect parsed dict
 
 
@@ -18,17 +17,33 @@ def test_load_json_safe_invalid_json():
     """Invalid JSON should log an error and return None."""  #(added docstring summarizing test intent)
     # invalid JSON logs error and returns None
     bad = '{invalid'  # malformed json text
-    with patch('os.path.exists', return_value=True):  # pretend file exists
-        with patch('builtins.open', mock_open(read_data=bad)):  # mock file open
-            with patch('src.utils.file_utils.logger') as log:  # capture logs
-                result = load_json_safe('bad.json')  # call util
-                log.error.assert_called()  # ensure logged
+    with patch('builtins.open', mock_open(read_data=bad)):  # mock file open
+        with patch('src.utils.file_utils.logger') as log:  # capture logs
+            result = load_json_safe('bad.json')  # call util
+            log.error.assert_called()  # ensure logged
     assert result is None  # expect None result
 
 
-def test_load_json_safe_missing_file():
+def test_load_json_safe_missing_file(tmp_path):
     """Return None when attempting to read a missing file."""  #(added docstring summarizing test intent)
-    # nonexistent file yields None
-    with patch('os.path.exists', return_value=False):  # path does not exist
-        result = load_json_safe('missing.json')  # call util
+    # nonexistent file yields None through the FileNotFoundError path
+    result = load_json_safe(str(tmp_path / 'missing.json'))  # path guaranteed absent
     assert result is None  # expect None result
+
+
+def test_load_json_safe_uses_fast_loader():
+    """Parsing goes through the module's selected JSON loader."""  # docstring summarizing test intent
+    with patch('builtins.open', mock_open(read_data=b'[1, 2]')):  # mock binary file open
+        with patch('src.utils.file_utils._json_loads', return_value=[1, 2]) as loads:  # capture loader
+            result = load_json_safe('list.json')  # call util
+    loads.assert_called_once_with(b'[1, 2]')  # whole file handed to loader once as raw bytes
+    assert result == [1, 2]  # parsed value returned
+
+
+def test_load_json_safe_missing_file_no_stat(tmp_path):
+    """A missing file is detected by the open call alone."""  # docstring summarizing test intent
+    with patch('os.path.exists', side_effect=AssertionError('no separate stat')):  # exists() must not run
+        with patch('src.utils.file_utils.logger') as log:  # capture logs
+            result = load_json_safe(str(tmp_path / 'absent.json'))  # call util
+    assert result is None  # missing file yields None
+    log.error.assert_not_called()  # missing file stays quiet
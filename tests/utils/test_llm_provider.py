@@ -23,7 +23,7 @@ def stub_module(name, attrs=None):
 
 
 # Stub external modules so llm_provider imports without network packages
-stub_module('openai', {'OpenAI': Dummy})  # (create fake OpenAI class)
+stub_module('openai', {'OpenAI': Dummy})  # (create fake OpenAI classes)
 stub_module('langchain_openai', {'ChatOpenAI': Dummy, 'AzureChatOpenAI': Dummy})  # (fake openai classes)
 stub_module('langchain_ollama', {'ChatOllama': Dummy})  # (fake ollama class)
 stub_module('langchain_anthropic', {'ChatAnthropic': Dummy})  # (fake anthropic)
@@ -46,12 +46,12 @@ stub_module('langchain_core.load', {'dumpd': lambda *a, **k: {}, 'dumps': lambda
 stub_module(
     'langchain_core.messages',
     {
-        'AIMessage': Dummy,
-        'SystemMessage': Dummy,
+        'AIMessage': type('AIMessage', (Dummy,), {}),  # (distinct class per message type)
+        'SystemMessage': type('SystemMessage', (Dummy,), {}),
         'AnyMessage': Dummy,
         'BaseMessage': Dummy,
         'BaseMessageChunk': Dummy,
-        'HumanMessage': Dummy,
+        'HumanMessage': type('HumanMessage', (Dummy,), {}),
         'convert_to_messages': lambda x: x,
         'message_chunk_to_message': lambda x: x,
     },
@@ -78,6 +78,7 @@ def test_openai_requires_key(monkeypatch):
     monkeypatch.delenv('CODEX', raising=False)  #// ensure online behaviour
     # missing API key raises error
     monkeypatch.delenv('OPENAI_API_KEY', raising=False)  # (clear env var)
+    llm_provider.clear_llm_model_cache()  # drop models built with an earlier key
     with pytest.raises(ValueError):  # (expect error)
         llm_provider.get_llm_model('openai')  # (call provider)
 
@@ -113,6 +114,7 @@ def test_anthropic_requires_key(monkeypatch):
     monkeypatch.delenv('CODEX', raising=False)  #// ensure online behaviour
     # anthropic needs API key
     monkeypatch.delenv('ANTHROPIC_API_KEY', raising=False)  #(description of change & current functionality)
+    llm_provider.clear_llm_model_cache()  # drop models built with an earlier key
     with pytest.raises(ValueError):  #(description of change & current functionality)
         llm_provider.get_llm_model('anthropic')  #(description of change & current functionality)
 
@@ -125,7 +127,7 @@ def test_anthropic_custom_params(monkeypatch):
     model = llm_provider.get_llm_model(  #(description of change & current functionality)
         'anthropic', base_url='https://anthropic', temperature=0.2  #(description of change & current functionality)
     )  #(description of change & current functionality)
-    assert isinstance(model, llm_provider.ChatAnthropic)  #(description of change & current functionality)
+    assert isinstance(model, sys.modules['langchain_anthropic'].ChatAnthropic)  # class from the installed stub module
     assert model.kwargs['base_url'] == 'https://anthropic'  #(description of change & current functionality)
     assert model.kwargs['temperature'] == 0.2  #(description of change & current functionality)
 
@@ -151,3 +153,142 @@ def test_get_llm_model_offline(monkeypatch):
     assert isinstance(result, llm_provider.AIMessage)  #// type check offline result
     assert result.kwargs.get('content') == 'mock response'  #// confirm mocked content
     monkeypatch.delenv('CODEX', raising=False)  #// cleanup env var
+
+
+def test_deepseek_r1_ainvoke_awaits_async_client(monkeypatch):
+    """DeepSeek R1 ainvoke awaits the async client instead of blocking."""  # docstring summarizing test intent
+    monkeypatch.delenv('CODEX', raising=False)  #// ensure online behaviour
+    calls = []  # captured request kwargs
+
+    class FakeCompletions:
+        async def create(self, **kwargs):
+            calls.append(kwargs)  # record request
+            message = types.SimpleNamespace(content='answer', reasoning_content='why')  # fake reply
+            return types.SimpleNamespace(choices=[types.SimpleNamespace(message=message)])
+
+    model = llm_provider.DeepSeekR1ChatOpenAI(base_url='http://api', api_key='sk-test')  # build wrapper
+    model.model_name = 'deepseek-reasoner'  # stubbed base class has no model field
+    model.root_client = None  # sync client must not be used by ainvoke
+    model.root_async_client = types.SimpleNamespace(chat=types.SimpleNamespace(completions=FakeCompletions()))
+    prompt = types.SimpleNamespace(content='hi')  # minimal message object
+    result = asyncio.run(model.ainvoke([prompt]))  # run async call
+    assert calls[0]['model'] == 'deepseek-reasoner'  # request sent once
+    assert calls[0]['messages'][0]['content'] == 'hi'  # history converted
+    assert result.kwargs == {'content': 'answer', 'reasoning_content': 'why'}  # reply unpacked
+
+
+def test_deepseek_r1_keeps_langchain_clients():
+    """The wrapper leaves ChatOpenAI's client fields to the base class."""  # docstring summarizing test intent
+    model = llm_provider.DeepSeekR1ChatOpenAI(base_url='http://api', api_key='sk-a')  # build wrapper
+    assert 'client' not in vars(model)  # chat.completions resource not replaced
+    assert 'async_client' not in vars(model)  # LangChain astream/agenerate keep working
+
+
+def test_get_llm_model_reuses_instance(monkeypatch):
+    """Identical settings return the cached model instance."""  # docstring summarizing test intent
+    monkeypatch.delenv('CODEX', raising=False)  #// ensure online behaviour
+    monkeypatch.setenv('OPENAI_API_KEY', 'sk-test')  # (set env var)
+    llm_provider.clear_llm_model_cache()  # start from an empty cache
+    first = llm_provider.get_llm_model('openai', model_name='gpt-4o', temperature=0.0)  # build model
+    second = llm_provider.get_llm_model('openai', temperature=0.0, model_name='gpt-4o')  # same settings, other order
+    other = llm_provider.get_llm_model('openai', model_name='gpt-4o', temperature=0.7)  # different settings
+    llm_provider.clear_llm_model_cache()  # leave no test models cached
+    assert first is second  # instance reused
+    assert other is not first  # settings are part of the key
+
+
+def test_get_llm_model_unhashable_kwargs_not_cached(monkeypatch):
+    """Unhashable option values bypass the cache instead of failing."""  # docstring summarizing test intent
+    monkeypatch.delenv('CODEX', raising=False)  #// ensure online behaviour
+    monkeypatch.setenv('OPENAI_API_KEY', 'sk-test')  # (set env var)
+    first = llm_provider.get_llm_model('openai', extra=['x'])  # list value cannot be hashed
+    second = llm_provider.get_llm_model('openai', extra=['x'])  # built again
+    assert first is not second  # no caching for unhashable settings
+
+
+def test_to_openai_messages_roles():
+    """Messages map to system/assistant/user roles in order."""  # docstring summarizing test intent
+    history = [
+        llm_provider.SystemMessage(),
+        llm_provider.AIMessage(),
+        llm_provider.HumanMessage(),
+        types.SimpleNamespace(),  # any other message is the user
+    ]
+    for i, message in enumerate(history):
+        message.content = f'm{i}'  # message text
+    converted = llm_provider._to_openai_messages(history)  # convert
+    assert converted == [
+        {'role': 'system', 'content': 'm0'},
+        {'role': 'assistant', 'content': 'm1'},
+        {'role': 'user', 'content': 'm2'},
+        {'role': 'user', 'content': 'm3'},
+    ]  # roles and order preserved
+
+
+def test_split_reasoning():
+    """Think blocks and JSON markers are split as before."""  # docstring summarizing test intent
+    assert llm_provider._split_reasoning('<think>why</think>answer') == ('why', 'answer')  # reasoning separated
+    assert llm_provider._split_reasoning('plain') == ('', 'plain')  # no think block
+    assert llm_provider._split_reasoning(
+        '<think>a</think>x**JSON Response:**y**JSON Response:**{}'
+    ) == ('a', '{}')  # text after last marker kept
+    assert llm_provider._split_reasoning('<think>a</think>b</think>c') == ('a', 'b</think>c')  # first tag splits
+
+
+def test_provider_sdk_imported_by_factory():
+    """Provider SDK classes are imported inside their factory, not bound at module import."""  # docstring summarizing test intent
+    assert 'ChatAnthropic' not in vars(llm_provider)  # not bound at import time
+    assert not hasattr(llm_provider, 'ChatMistralAI')  # no module-level alias either
+
+
+def test_siliconflow_alt_env_key(monkeypatch):
+    """SiliconFlow accepts the legacy key variable through the common lookup."""  # docstring summarizing test intent
+    monkeypatch.delenv('CODEX', raising=False)  #// ensure online behaviour
+    monkeypatch.delenv('SILICONFLOW_API_KEY', raising=False)  # primary name unset
+    monkeypatch.setenv('SiliconFLOW_API_KEY', 'sf-legacy')  # legacy spelling set
+    llm_provider.clear_llm_model_cache()  # drop models built with an earlier key
+    model = llm_provider.get_llm_model('siliconflow', model_name='Qwen/QwQ-32B')  # build model
+    llm_provider.clear_llm_model_cache()  # leave no test models cached
+    assert model.kwargs['api_key'] == 'sf-legacy'  # key resolved once, not re-read
+
+
+def test_mistral_uses_provided_key(monkeypatch):
+    """An explicit Mistral key is passed through unchanged."""  # docstring summarizing test intent
+    monkeypatch.delenv('CODEX', raising=False)  #// ensure online behaviour
+    monkeypatch.setenv('MISTRAL_API_KEY', 'env-key')  # env key present
+    model = llm_provider.get_llm_model('mistral', api_key='ui-key')  # explicit key wins
+    assert model.kwargs['api_key'] == 'ui-key'  # no second env lookup
+
+
+def test_provider_registry(monkeypatch):
+    """Providers dispatch through the factory registry."""  # docstring summarizing test intent
+    monkeypatch.delenv('CODEX', raising=False)  #// ensure online behaviour
+    expected = {'anthropic', 'mistral', 'openai', 'deepseek', 'google', 'ollama', 'azure_openai',
+                'alibaba', 'ibm', 'moonshot', 'unbound', 'siliconflow'}  # every supported provider
+    assert set(llm_provider._PROVIDER_FACTORIES) == expected  # all branches registered
+    monkeypatch.setenv('NOPE_API_KEY', 'k')  # key present so dispatch is reached
+    with pytest.raises(ValueError, match='Unsupported provider'):
+        llm_provider.get_llm_model('nope')  # unknown provider rejected
+
+
+def test_resolve_prefers_kwargs_then_env(monkeypatch):
+    """Explicit values win, then the env var, then the default."""  # docstring summarizing test intent
+    monkeypatch.setenv('X_ENDPOINT', 'http://env')  # env value available
+    assert llm_provider._resolve({'base_url': 'http://ui'}, 'base_url', 'X_ENDPOINT', 'd') == 'http://ui'  # kwarg wins
+    assert llm_provider._resolve({'base_url': ''}, 'base_url', 'X_ENDPOINT', 'd') == 'http://env'  # empty kwarg ignored
+    monkeypatch.delenv('X_ENDPOINT')  # no env value
+    assert llm_provider._resolve({}, 'base_url', 'X_ENDPOINT', 'd') == 'd'  # default last
+
+
+def test_get_llm_model_cache_keeps_no_plaintext_key(monkeypatch):
+    """Explicit API keys appear in the model cache only as digests."""  # docstring summarizing test intent
+    monkeypatch.delenv('CODEX', raising=False)  #// ensure online behaviour
+    llm_provider.clear_llm_model_cache()  # start from an empty cache
+    first = llm_provider.get_llm_model('openai', api_key='sk-secret-1')  # build with explicit key
+    again = llm_provider.get_llm_model('openai', api_key='sk-secret-1')  # same key
+    rotated = llm_provider.get_llm_model('openai', api_key='sk-secret-2')  # different key
+    keys = repr(list(llm_provider._LLM_MODEL_CACHE))  # everything held as cache keys
+    llm_provider.clear_llm_model_cache()  # leave no test models cached
+    assert first is again and rotated is not first  # keys still distinguish models
+    assert 'sk-secret' not in keys  # no plaintext key retained by the cache
+    assert not llm_provider._LLM_MODEL_CACHE  # clear hook empties it
@@ -87,6 +87,7 @@ def test_setup_mcp_client_success(monkeypatch):
     client = asyncio.run(setup_mcp_client_and_tools({'a': 1}))
     assert isinstance(client, SuccessClient)
     assert client.entered
+    asyncio.run(mcp_client.release_mcp_client(client))  # return the pooled client
 
 
 def test_setup_mcp_client_failure(monkeypatch):
@@ -128,3 +129,207 @@ def test_resolve_type_enum_array():
     array_type = resolve_type({'type': 'array', 'items': {'type': 'integer'}}, 'nums')
     assert issubclass(enum_type, Enum)
     assert getattr(array_type, '__origin__', None) is list
+
+
+def test_create_tool_param_model_cached_by_schema():
+    """Tools with equivalent schemas share one generated model."""  # docstring summarizing test intent
+    reordered = type('ReorderedTool', (), {
+        'name': 'tool',
+        'args_schema': {'required': ['req_field'], 'properties': dict(reversed(list(FakeTool.args_schema['properties'].items())))},
+    })  # same schema, different key order
+    renamed = type('RenamedTool', (), {'name': 'other', 'args_schema': FakeTool.args_schema})  # same schema, other name
+    first = create_tool_param_model(FakeTool)  # build or fetch model
+    assert create_tool_param_model(reordered) is first  # key order ignored
+    assert create_tool_param_model(renamed) is not first  # name is part of the key
+
+
+def test_resolve_type_cached_per_fragment():
+    """Repeated sub-schemas under one prefix resolve to the same generated class."""  # docstring summarizing test intent
+    first = resolve_type({'type': 'string', 'enum': ['p', 'q']}, 'one')  # create enum
+    again = resolve_type({'enum': ['p', 'q'], 'type': 'string'}, 'one')  # same fragment, same prefix
+    other = resolve_type({'type': 'string', 'enum': ['p', 'q']}, 'two')  # same values, other prefix
+    obj = {'type': 'object', 'properties': {'n': {'type': 'integer'}}}  # nested object schema
+    assert first is again  # repeated fragment resolved once
+    assert other.__name__ == 'two_Enum'  # never named after another tool's field
+    assert resolve_type(obj, 'nested') is resolve_type(dict(obj), 'nested')  # nested model reused
+    assert resolve_type(obj, 'nested').__name__ != resolve_type(obj, 'other').__name__  # prefixes keep models apart
+
+
+def test_create_tool_param_model_from_run_signature():
+    """Schema-less tools use cached hints from the class _run method."""  # docstring summarizing test intent
+    class RunTool:
+        name = 'runner'
+        args_schema = None
+        def _run(self, query: str, limit: int = 5):
+            return query
+    model = create_tool_param_model(RunTool())  # build from signature
+    assert model.__annotations__ == {'query': str, 'limit': int}  # self skipped, hints applied
+    assert model.limit == 5  # default kept
+    assert mcp_client._hints_for(RunTool) is mcp_client._hints_for(RunTool)  # hints computed once per class
+
+
+def test_resolve_type_formats_and_nullable():
+    """Module-level tables map formats and nullable unions as before."""  # docstring summarizing test intent
+    import datetime  # expected format type
+    from typing import Optional  # expected nullable wrapper
+    assert resolve_type({'type': 'string', 'format': 'date-time'}) is datetime.datetime  # mapped format
+    assert resolve_type({'type': 'string', 'format': 'hostname'}) is str  # unknown format
+    assert resolve_type({'type': ['integer', 'null']}) == Optional[int]  # nullable integer
+
+
+class CountingClient(DummyClient):
+    instances = []
+    def __init__(self, cfg):
+        self.cfg = cfg
+        self.exited = False
+        CountingClient.instances.append(self)
+    async def __aexit__(self, exc_type, exc, tb):
+        self.exited = True
+
+
+def test_setup_mcp_client_pooled(monkeypatch):
+    """Callers with the same config share one client until the last release."""  # docstring summarizing test intent
+    monkeypatch.delenv('CODEX', raising=False)  #// ensure online behaviour
+    monkeypatch.setattr(mcp_client, 'MultiServerMCPClient', CountingClient)
+    CountingClient.instances.clear()  # fresh count for this test
+
+    async def scenario():
+        first, second = await asyncio.gather(
+            setup_mcp_client_and_tools({'mcpServers': {'s': {'url': 'x'}}}),
+            setup_mcp_client_and_tools({'s': {'url': 'x'}}),
+        )  # concurrent setup with equivalent configs
+        other = await setup_mcp_client_and_tools({'s': {'url': 'y'}})  # different servers
+        await mcp_client.release_mcp_client(first)  # one holder remains
+        still_open = not first.exited
+        await mcp_client.release_mcp_client(second)  # last holder closes it
+        await mcp_client.release_mcp_client(other)
+        return first, second, other, still_open
+
+    first, second, other, still_open = asyncio.run(scenario())
+    assert first is second and other is not first  # shared per config
+    assert len(CountingClient.instances) == 2  # one handshake per distinct config
+    assert still_open and first.exited and other.exited  # closed after last release
+    assert not mcp_client._CLIENT_POOL  # pool emptied
+
+
+class HangingClient(CountingClient):
+    async def __aenter__(self):
+        await asyncio.sleep(10)  # server that never finishes its handshake
+        return self
+
+
+def test_setup_mcp_client_timeout(monkeypatch):
+    """A hung connect returns None after the timeout and cleans up."""  # docstring summarizing test intent
+    monkeypatch.delenv('CODEX', raising=False)  #// ensure online behaviour
+    monkeypatch.setattr(mcp_client, 'MultiServerMCPClient', HangingClient)
+    CountingClient.instances.clear()  # fresh count for this test
+    client = asyncio.run(setup_mcp_client_and_tools({'s': {'url': 'slow'}}, timeout=0.01))
+    assert client is None  # gave up instead of blocking
+    assert CountingClient.instances[0].exited  # partial connection closed
+    assert not mcp_client._CLIENT_POOL  # failed client not pooled
+
+
+class SlowClient(CountingClient):
+    async def __aenter__(self):
+        await asyncio.sleep(0.05)  # handshake still running when a caller is cancelled
+        return self
+
+
+def test_setup_mcp_client_cancel_one_waiter(monkeypatch):
+    """Cancelling one caller leaves the shared connect running for the others."""  # docstring summarizing test intent
+    monkeypatch.delenv('CODEX', raising=False)  #// ensure online behaviour
+    monkeypatch.setattr(mcp_client, 'MultiServerMCPClient', SlowClient)
+    CountingClient.instances.clear()  # fresh count for this test
+
+    async def scenario():
+        cfg = {'s': {'url': 'shared'}}  # same config for both callers
+        doomed = asyncio.ensure_future(setup_mcp_client_and_tools(cfg))
+        survivor = asyncio.ensure_future(setup_mcp_client_and_tools(cfg))
+        await asyncio.sleep(0.01)  # both callers waiting on the handshake
+        doomed.cancel()  # e.g. a stop button on one agent
+        client = await survivor
+        refs = [refs for _, refs in mcp_client._CLIENT_POOL.values()]
+        await mcp_client.release_mcp_client(client)
+        return doomed, client, refs
+
+    doomed, client, refs = asyncio.run(scenario())
+    assert doomed.cancelled()  # cancelled caller sees its own cancellation
+    assert isinstance(client, SlowClient) and client.exited  # survivor connected, then released
+    assert refs == [1]  # cancelled caller's reference was dropped
+    assert not mcp_client._CLIENT_POOL  # pool emptied
+
+
+def test_setup_mcp_client_cancel_last_waiter(monkeypatch):
+    """Cancelling the only caller stops the connect and empties the pool."""  # docstring summarizing test intent
+    monkeypatch.delenv('CODEX', raising=False)  #// ensure online behaviour
+    monkeypatch.setattr(mcp_client, 'MultiServerMCPClient', SlowClient)
+    CountingClient.instances.clear()  # fresh count for this test
+
+    async def scenario():
+        waiter = asyncio.ensure_future(setup_mcp_client_and_tools({'s': {'url': 'lonely'}}))
+        await asyncio.sleep(0.01)  # handshake in progress
+        waiter.cancel()
+        await asyncio.sleep(0.01)  # let the connect task unwind
+        return waiter
+
+    assert asyncio.run(scenario()).cancelled()
+    assert CountingClient.instances[0].exited  # partial connection closed
+    assert not mcp_client._CLIENT_POOL  # nothing left behind
+
+
+def test_setup_mcp_client_timeout_per_caller(monkeypatch):
+    """A later caller's shorter timeout applies to that caller only."""  # docstring summarizing test intent
+    monkeypatch.delenv('CODEX', raising=False)  #// ensure online behaviour
+    monkeypatch.setattr(mcp_client, 'MultiServerMCPClient', SlowClient)
+    CountingClient.instances.clear()  # fresh count for this test
+
+    async def scenario():
+        cfg = {'s': {'url': 'deadlines'}}  # same config for both callers
+        patient = asyncio.ensure_future(setup_mcp_client_and_tools(cfg, timeout=5))
+        impatient = asyncio.ensure_future(setup_mcp_client_and_tools(cfg, timeout=0.01))
+        short, client = await asyncio.wait_for(asyncio.gather(impatient, patient), 1)
+        await mcp_client.release_mcp_client(client)
+        return short, client
+
+    short, client = asyncio.run(scenario())
+    assert short is None  # short deadline honoured although the entry was created with a longer one
+    assert isinstance(client, SlowClient) and client.exited  # patient caller still connected
+    assert len(CountingClient.instances) == 1  # one shared handshake
+    assert not mcp_client._CLIENT_POOL  # pool emptied
+
+
+def test_resolve_type_bool_enum_not_confused_with_int_enum():
+    """Equal-comparing scalars of different types get separate cache entries."""  # docstring summarizing test intent
+    int_enum = resolve_type({'enum': [0, 1]}, 'ints')  # integer enum first
+    bool_enum = resolve_type({'enum': [False, True]}, 'bools')  # would collide on value equality
+    assert int_enum is not bool_enum  # distinct classes
+    assert [m.value for m in bool_enum] == [False, True]  # bool values preserved
+    assert all(type(m.value) is bool for m in bool_enum)  # not ints
+
+
+class FailingExitClient(CountingClient):
+    async def __aexit__(self, exc_type, exc, tb):
+        raise RuntimeError('close failed')
+
+
+def test_drop_waiter_closes_orphan_in_tracked_task(monkeypatch):
+    """A client finished after its last waiter left is closed by a tracked, logged task."""  # docstring summarizing test intent
+    from unittest.mock import MagicMock  # capture log calls
+    log = MagicMock()  # stand-in logger
+    monkeypatch.setattr(mcp_client, 'logger', log)
+
+    async def scenario():
+        connect = asyncio.ensure_future(asyncio.sleep(0, result=FailingExitClient({})))  # already-connected client
+        await connect
+        key = ('loop', 'orphan')  # pool key as used by setup
+        entry = mcp_client._CLIENT_POOL[key] = [connect, 1]
+        mcp_client._drop_waiter(key, entry)  # last waiter leaves after connect finished
+        pending = set(mcp_client._CLOSING_TASKS)  # close is tracked
+        await asyncio.sleep(0.01)  # let the close run
+        return pending
+
+    pending = asyncio.run(scenario())
+    assert len(pending) == 1  # referenced while running
+    assert not mcp_client._CLOSING_TASKS  # forgotten once done
+    assert log.debug.called  # failure logged, not left unretrieved
+    assert not mcp_client._CLIENT_POOL  # entry discarded
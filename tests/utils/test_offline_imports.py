@@ -57,7 +57,7 @@ def test_llm_provider_offline(monkeypatch):
         def __init__(self, *a, **k):
             self.kwargs = k  #// store kwargs for inspection
 
-    stub_module("openai", {"OpenAI": Dummy})  #// stub OpenAI class
+    stub_module("openai", {"OpenAI": Dummy})  #// stub OpenAI classes
     stub_module("langchain_openai", {"ChatOpenAI": Dummy, "AzureChatOpenAI": Dummy})  #// stub openai chat classes
     stub_module("langchain_ollama", {"ChatOllama": Dummy})  #// stub ollama class
     stub_module("langchain_anthropic", {"ChatAnthropic": Dummy})  #// stub anthropic class
@@ -4,21 +4,26 @@ sys.modules.setdefault("requests", types.ModuleType("requests"))
 sys.modules.setdefault("gradio", types.ModuleType("gradio"))
 sys.path.append('.')  # include project root
 import base64  # for expected encoding
-from types import SimpleNamespace  # create fake stat
-from unittest.mock import MagicMock, mock_open, patch  # mocking tools
+import os  # set file mtimes
+from unittest.mock import patch  # mocking tools
 from src.utils.utils import encode_image, get_latest_files  # functions under test
 
 
-def test_encode_image_success():
+def test_encode_image_success(tmp_path):
     """Binary image data should be encoded to base64 string."""  #(added docstring summarizing test intent)
     # encode bytes and return base64 string
-    data = b'abc'  # sample bytes
-    m = mock_open(read_data=data)  # mock binary file
-    m.return_value.read.return_value = data  # ensure bytes returned
+    data = b'abc\x00\xff' * 1000  # sample binary bytes
+    img = tmp_path / 'img.png'  # real file so it can be memory-mapped
+    img.write_bytes(data)  # write sample
     expected = base64.b64encode(data).decode('utf-8')  # expected string
-    with patch('builtins.open', m):  # patch open
-        result = encode_image('img.png')  # call util
-    assert result == expected  # compare result
+    assert encode_image(str(img)) == expected  # compare result
+
+
+def test_encode_image_empty_file(tmp_path):
+    """Empty files encode to an empty string instead of failing to map."""  # docstring summarizing test intent
+    img = tmp_path / 'empty.png'  # zero-byte file
+    img.write_bytes(b'')  # create it
+    assert encode_image(str(img)) == ''  # empty base64 string
 
 
 def test_encode_image_none():
@@ -27,34 +32,24 @@ def test_encode_image_none():
     assert encode_image(None) is None  # expect None returned
 
 
-def fake_path(path, mtime):  # helper to build fake Path
-    """Return a mock Path object with predetermined modification time."""  #(added docstring describing helper purpose)
-    stat = SimpleNamespace(st_mtime=mtime)  # fake stat object
-    p = MagicMock()  # create mock path
-    p.stat.return_value = stat  # stub stat
-    p.__str__.return_value = path  # str output
-    return p  # return mock
+def make_file(path, mtime):  # helper to build a real file
+    """Create ``path`` with a fixed modification time."""  # docstring describing helper purpose
+    path.parent.mkdir(parents=True, exist_ok=True)  # allow nested locations
+    path.write_bytes(b'x')  # minimal content
+    os.utime(path, (mtime, mtime))  # pin mtime
+    return str(path)  # path string as returned by util
 
 
-def test_get_latest_files():
+def test_get_latest_files(tmp_path):
     """Return the latest file per extension from a directory."""  #(added docstring summarizing test intent)
     # select most recent file for each extension
-    webm1 = fake_path('/dir/a.webm', 50)  # older webm
-    webm2 = fake_path('/dir/b.webm', 100)  # newer webm
-    zip1 = fake_path('/dir/a.zip', 60)  # zip file
-    with patch('os.path.exists', return_value=True):  # pretend dir exists
-        with patch('src.utils.utils.Path.rglob') as rg:  # patch file search
-            with patch('time.time', return_value=150):  # fixed time
-                def side(pattern):  # side effect per extension
-                    if pattern == '*.webm':  # match webm
-                        return [webm1, webm2]  # return list
-                    if pattern == '*.zip':  # match zip
-                        return [zip1]  # return list
-                    return []  # default empty
-                rg.side_effect = side  # assign side effect
-                result = get_latest_files('/dir')  # call util
-    assert result['.webm'] == '/dir/b.webm'  # newest webm path
-    assert result['.zip'] == '/dir/a.zip'  # latest zip path
+    make_file(tmp_path / 'a.webm', 50)  # older webm
+    newer = make_file(tmp_path / 'nested' / 'b.webm', 100)  # newer webm in subdirectory
+    zip1 = make_file(tmp_path / 'a.zip', 60)  # zip file
+    make_file(tmp_path / 'c.txt', 120)  # unrelated extension
+    with patch('time.time', return_value=150):  # fixed time
+        result = get_latest_files(str(tmp_path))  # call util
+    assert result == {'.webm': newer, '.zip': zip1}  # newest path per extension
 
 
 def test_get_latest_files_missing_dir():
@@ -65,3 +60,32 @@ def test_get_latest_files_missing_dir():
             result = get_latest_files('/missing')  # call util
             mk.assert_called_once_with('/missing')  # ensure called
     assert result == {'.webm': None, '.zip': None}  # expect empty dict
+
+
+def test_get_latest_files_single_walk(tmp_path):
+    """The tree is scanned once regardless of how many extensions are requested."""  # docstring summarizing test intent
+    make_file(tmp_path / 'sub' / 'a.webm', 50)  # one match in a subdirectory
+    make_file(tmp_path / 'fresh.zip', 149.5)  # still being written
+    real_scandir = os.scandir  # keep original for delegation
+    with patch('os.scandir', side_effect=real_scandir) as scan:  # count directory scans
+        with patch('time.time', return_value=150):  # fixed time
+            result = get_latest_files(str(tmp_path), ['.webm', '.zip'])  # call util
+    assert scan.call_count == 2  # root and subdirectory, not once per extension
+    assert result == {'.webm': str(tmp_path / 'sub' / 'a.webm'), '.zip': None}  # fresh zip skipped
+
+
+def test_get_latest_files_multi_part_suffix(tmp_path):
+    """Requested types match the end of the filename, so multi-part suffixes work."""  # docstring summarizing test intent
+    archive = make_file(tmp_path / 'trace.tar.gz', 50)  # two-part suffix
+    with patch('time.time', return_value=150):  # fixed time
+        result = get_latest_files(str(tmp_path), ['.tar.gz', '.gz'])  # overlapping requests
+    assert result == {'.tar.gz': archive, '.gz': archive}  # same file satisfies both
+
+
+def test_get_latest_files_entry_error_does_not_stop_scan(tmp_path):
+    """A file that vanishes mid-scan is skipped without losing its siblings."""  # docstring summarizing test intent
+    (tmp_path / 'gone.webm').symlink_to(tmp_path / 'missing-target')  # broken link: stat() raises
+    kept = make_file(tmp_path / 'sub' / 'kept.webm', 50)  # sibling subdirectory still scanned
+    with patch('time.time', return_value=150):  # fixed time
+        result = get_latest_files(str(tmp_path), ['.webm'])  # call util
+    assert result == {'.webm': kept}  # broken entry skipped, rest found